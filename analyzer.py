@@ -266,19 +266,28 @@ from __future__ import annotations
 
 import argparse
 import gc
+import hashlib
 import json
 import math
+import os
 import re
 import subprocess
 import sys
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import soundfile as sf
 import librosa
-from scipy.signal import resample_poly, butter, sosfilt
+from numba import get_num_threads, njit, prange, set_num_threads
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft as sp_fft
+from scipy.signal import firwin, butter, get_window, sosfilt
 
 # Import interpretative texts generator
 try:
@@ -540,112 +549,63 @@ class ScoringThresholds:
     Single source of truth for ALL scoring logic
     """
 
+    # Plain numeric boundaries, read by one if/elif chain per metric in the
+    # calculate_*_score functions below. Every band is listed with the exact
+    # comparison it uses there.
+
+    # critical: peak >= critical
+    # warning:  peak > warning (>= when warning_inclusive)
+    # perfect:  peak <= perfect
+    # pass:     between warning and perfect
+    # "conservative" is never assigned: more headroom is never penalized.
     HEADROOM = {
-        "strict": {
-            "critical": lambda peak: peak >= -1.0,
-            "warning": lambda peak: (-4.0 <= peak < -1.0),
-            "perfect": lambda peak: peak <= -5.0,
-            "pass": lambda peak: -5.0 < peak < -4.0,
-            "conservative": lambda peak: False,  # Unreachable: more headroom is never penalized
-        },
-        "normal": {
-            "critical": lambda peak: peak >= -1.0,
-            "warning": lambda peak: -2.0 < peak < -1.0,
-            "perfect": lambda peak: peak <= -3.0,
-            "pass": lambda peak: -3.0 < peak <= -2.0,
-            "conservative": lambda peak: False,  # Unreachable: more headroom is never penalized
-        },
+        "strict": {"critical": -1.0, "warning": -4.0, "warning_inclusive": True, "perfect": -5.0},
+        "normal": {"critical": -1.0, "warning": -2.0, "warning_inclusive": False, "perfect": -3.0},
         # Ceiling compliance, not room for the engineer. The only defect is being
         # pinned at full scale, which is also where sample clipping lives: it is
-        # scored here rather than hard-failing the file.
-        "master": {
-            "critical": lambda peak: peak >= 0.0,
-            "warning": lambda peak: False,
-            "perfect": lambda peak: peak <= -0.1,
-            "pass": lambda peak: -0.1 < peak < 0.0,
-            "conservative": lambda peak: False,
-        }
+        # scored here rather than hard-failing the file. No warning band: a
+        # warning above 0.0 is already critical.
+        "master": {"critical": 0.0, "warning": 0.0, "warning_inclusive": False, "perfect": -0.1},
     }
 
+    # critical: tp >= critical (> when not critical_inclusive)
+    # warning:  tp > warning
+    # perfect:  tp <= perfect
+    # pass:     between perfect and warning
     TRUE_PEAK = {
-        "strict": {
-            "critical": lambda tp: tp >= -0.5,
-            "warning": lambda tp: -3.0 < tp < -0.5,  # Expandido: incluye -3 a -0.5
-            "perfect": lambda tp: tp <= -3.0,
-            "pass": lambda tp: False,  # Eliminado: solo perfect o warning/critical
-        },
-        "normal": {
-            "critical": lambda tp: tp >= -0.5,
-            "warning": lambda tp: -1.0 < tp < -0.5,
-            "perfect": lambda tp: tp <= -3.0,
-            "pass": lambda tp: -3.0 < tp <= -1.0,
-        },
+        # Sin banda pass: warning se expandió hasta -3 (solo perfect o warning/critical)
+        "strict": {"critical": -0.5, "critical_inclusive": True, "warning": -3.0, "perfect": -3.0},
+        "normal": {"critical": -0.5, "critical_inclusive": True, "warning": -1.0, "perfect": -3.0},
         # Not anchored at -1.0 dBTP: zero of the 18 measured chart masters meet it
         # and the median commercial true peak is +0.32 dBTP. Anchoring the rubric
         # to a spec the market ignores is the bug being fixed. -1.0 dBTP survives
         # as advice in the copy, not as a scoring threshold.
-        "master": {
-            "critical": lambda tp: tp > 2.0,
-            "warning": lambda tp: 1.0 < tp <= 2.0,
-            "perfect": lambda tp: tp <= 0.0,
-            "pass": lambda tp: 0.0 < tp <= 1.0,
-        }
+        "master": {"critical": 2.0, "critical_inclusive": False, "warning": 1.0, "perfect": 0.0},
     }
 
+    # perfect: plr >= perfect, pass: plr >= pass, warning: plr >= warning, else critical
     PLR = {
-        "strict": {
-            "perfect": lambda plr: plr >= 14.0,
-            "pass": lambda plr: 12.0 <= plr < 14.0,      # Más alto: antes era 10
-            "warning": lambda plr: 10.0 <= plr < 12.0,    # NUEVO rango
-            "critical": lambda plr: plr < 10.0,           # Lo que era 7-10 ahora es critical
-        },
-        "normal": {
-            "perfect": lambda plr: plr >= 12.0,
-            "pass": lambda plr: 8.0 <= plr < 12.0,
-            "warning": lambda plr: 6.0 <= plr < 8.0,
-            "critical": lambda plr: plr < 6.0,
-        },
+        # Más alto: pass antes empezaba en 10. Lo que era 7-10 ahora es critical
+        "strict": {"perfect": 14.0, "pass": 12.0, "warning": 10.0},
+        "normal": {"perfect": 12.0, "pass": 8.0, "warning": 6.0},
         # Genre-independent floor. MeterPlugs, asked directly whether EDM and metal
         # deserve a lower floor, said no: what varies by genre is the variety of
         # PSR within a track, not the minimum.
-        "master": {
-            "perfect": lambda plr: plr >= 10.0,
-            "pass": lambda plr: 8.0 <= plr < 10.0,
-            "warning": lambda plr: 6.0 <= plr < 8.0,
-            "critical": lambda plr: plr < 6.0,
-        }
+        "master": {"perfect": 10.0, "pass": 8.0, "warning": 6.0},
     }
 
     # v7.4.1 FIX: Restored strict mode differentiation for stereo
     # Strict shifts each boundary +0.05 (same pattern as headroom/PLR strict offsets)
     # Bars remain mode-independent; text evaluation is stricter
+    # catastrophic: corr < 0 (phase issues), then each status holds while corr
+    # is below its upper bound: critical < critical, poor < poor, warning <
+    # warning, pass < pass, else perfect.
     STEREO_WIDTH = {
-        "strict": {
-            "perfect": lambda corr: corr >= 0.75,       # Strict demands higher correlation
-            "pass": lambda corr: 0.55 <= corr < 0.75,
-            "warning": lambda corr: 0.35 <= corr < 0.55,
-            "poor": lambda corr: 0.15 <= corr < 0.35,
-            "critical": lambda corr: 0 <= corr < 0.15,
-            "catastrophic": lambda corr: corr < 0,
-        },
-        "normal": {
-            "perfect": lambda corr: corr >= 0.7,        # ≥0.7 excellent
-            "pass": lambda corr: 0.5 <= corr < 0.7,     # 0.5-0.7 good
-            "warning": lambda corr: 0.3 <= corr < 0.5,  # 0.3-0.5 warning
-            "poor": lambda corr: 0.1 <= corr < 0.3,     # 0.1-0.3 poor
-            "critical": lambda corr: 0 <= corr < 0.1,   # 0-0.1 critical
-            "catastrophic": lambda corr: corr < 0,      # Negative = phase issues
-        },
+        "strict": {"critical": 0.15, "poor": 0.35, "warning": 0.55, "pass": 0.75},
+        "normal": {"critical": 0.1, "poor": 0.3, "warning": 0.5, "pass": 0.7},
         # Unchanged from the mix rubric: a collapsed stereo field is a defect at
         # any stage.
-        "master": {
-            "perfect": lambda corr: corr >= 0.7,
-            "pass": lambda corr: 0.5 <= corr < 0.7,
-            "warning": lambda corr: 0.3 <= corr < 0.5,
-            "poor": lambda corr: 0.1 <= corr < 0.3,
-            "critical": lambda corr: 0 <= corr < 0.1,
-            "catastrophic": lambda corr: corr < 0,
-        }
+        "master": {"critical": 0.1, "poor": 0.3, "warning": 0.5, "pass": 0.7},
     }
 
     SCORES = {
@@ -664,20 +624,18 @@ def calculate_headroom_score(peak_db: float, profile: str) -> Tuple[str, float]:
     Calculate headroom score WITHOUT language dependency.
     Returns: (status, score_delta)
     """
-    thresholds = ScoringThresholds.HEADROOM[threshold_key(profile)]
+    t = ScoringThresholds.HEADROOM[threshold_key(profile)]
 
-    if thresholds["critical"](peak_db):
+    if peak_db >= t["critical"]:
         return "critical", ScoringThresholds.SCORES["critical"]
-    elif thresholds["warning"](peak_db):
+    elif peak_db > t["warning"] or (t["warning_inclusive"] and peak_db == t["warning"]):
         return "warning", ScoringThresholds.SCORES["warning"]
-    elif thresholds["perfect"](peak_db):
+    elif peak_db <= t["perfect"]:
         return "perfect", ScoringThresholds.SCORES["perfect"]
-    elif thresholds["pass"](peak_db):
+    elif peak_db > t["perfect"]:
         return "pass", ScoringThresholds.SCORES["pass"]
-    elif thresholds["conservative"](peak_db):
-        return "conservative", ScoringThresholds.SCORES["conservative"]
     else:
-        # Safety fallback — should be unreachable after threshold fix
+        # Safety fallback (NaN) — should be unreachable after threshold fix
         return "perfect", ScoringThresholds.SCORES["perfect"]
 
 
@@ -689,18 +647,18 @@ def calculate_true_peak_score(tp_db: float, profile: str) -> Tuple[str, float, b
     Hard fail SOLO si True Peak >= +3.0 dBTP (clipping intersample extremo).
     Es el único hard fail del sistema, en los tres perfiles.
     """
-    thresholds = ScoringThresholds.TRUE_PEAK[threshold_key(profile)]
+    t = ScoringThresholds.TRUE_PEAK[threshold_key(profile)]
 
     # Hard fail solo para casos EXTREMOS (>= +3.0 dBTP)
     if tp_db >= 3.0:
         return "critical", ScoringThresholds.SCORES["critical"], True
 
     # True Peak crítico pero corregible (< +3.0)
-    if thresholds["critical"](tp_db):
+    if tp_db > t["critical"] or (t["critical_inclusive"] and tp_db == t["critical"]):
         return "critical", ScoringThresholds.SCORES["critical"], False
-    elif thresholds["warning"](tp_db):
+    elif tp_db > t["warning"]:
         return "warning", 0.3 if profile == PROFILE_MIX_STRICT else 0.4, False
-    elif thresholds["perfect"](tp_db):
+    elif tp_db <= t["perfect"]:
         return "perfect", ScoringThresholds.SCORES["perfect"], False
     else:  # pass
         return "pass", ScoringThresholds.SCORES["pass"], False
@@ -714,13 +672,13 @@ def calculate_plr_score(plr_db: float, lufs_reliable: bool, profile: str) -> Tup
     if not lufs_reliable:
         return "pass", 0.5
 
-    thresholds = ScoringThresholds.PLR[threshold_key(profile)]
+    t = ScoringThresholds.PLR[threshold_key(profile)]
 
-    if thresholds["perfect"](plr_db):
+    if plr_db >= t["perfect"]:
         return "perfect", ScoringThresholds.SCORES["perfect"]
-    elif thresholds["pass"](plr_db):
+    elif plr_db >= t["pass"]:
         return "pass", ScoringThresholds.SCORES["pass"]
-    elif thresholds["warning"](plr_db):
+    elif plr_db >= t["warning"]:
         return "warning", 0.3
     else:  # critical
         return "critical", -0.5
@@ -748,17 +706,17 @@ def calculate_stereo_score(correlation: float, profile: str) -> Tuple[str, float
     Strict: ≥0.75 excellent, 0.55-0.75 good, 0.35-0.55 warning, 0.15-0.35 poor, <0.15 critical
     Master: same as normal.
     """
-    thresholds = ScoringThresholds.STEREO_WIDTH[threshold_key(profile)]
+    t = ScoringThresholds.STEREO_WIDTH[threshold_key(profile)]
 
-    if thresholds["catastrophic"](correlation):
+    if correlation < 0:
         return "catastrophic", ScoringThresholds.SCORES["catastrophic"]
-    elif thresholds["critical"](correlation):
+    elif correlation < t["critical"]:
         return "critical", ScoringThresholds.SCORES["critical"]
-    elif thresholds["poor"](correlation):
+    elif correlation < t["poor"]:
         return "poor", ScoringThresholds.SCORES["poor"]
-    elif thresholds["warning"](correlation):
+    elif correlation < t["warning"]:
         return "warning", ScoringThresholds.SCORES["warning"]
-    elif thresholds["pass"](correlation):
+    elif correlation < t["pass"]:
         return "pass", ScoringThresholds.SCORES["pass"]
     else:  # perfect
         return "perfect", ScoringThresholds.SCORES["perfect"]
@@ -888,8 +846,9 @@ def calculate_minimum_score(metrics: List[Dict[str, Any]]) -> int:
     ser corregidos. Un score de 0 implica "completamente inútil", lo cual
     rara vez es cierto en producción musical.
     """
-    catastrophic_count = sum(1 for m in metrics if m.get("status") == "catastrophic")
-    critical_count = sum(1 for m in metrics if m.get("status") == "critical")
+    status_counts = Counter(m.get("status") for m in metrics)
+    catastrophic_count = status_counts["catastrophic"]
+    critical_count = status_counts["critical"]
     
     if catastrophic_count >= 2:
         return 10  # Múltiples problemas catastróficos (ej: fase invertida + clipping extremo)
@@ -927,9 +886,214 @@ def calculate_maximum_score(metrics: List[Dict[str, Any]], profile: str) -> int:
 # ----------------------------
 # Audio utilities
 # ----------------------------
-def peak_dbfs(y: np.ndarray) -> float:
+def _available_cpus() -> int:
+    """
+    Cores que el proceso puede usar de verdad: la afinidad de CPU, acotada por
+    la cuota de cgroup (v2 cpu.max o v1 cfs_quota_us) redondeada hacia arriba.
+    En un contenedor con cuota (Render Starter: 0.5 CPU) os.cpu_count() da los
+    cores del host, no los del contenedor.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS / Windows
+        cpus = os.cpu_count() or 1
+    for quota_file, period_file in (
+        ("/sys/fs/cgroup/cpu.max", None),
+        ("/sys/fs/cgroup/cpu/cpu.cfs_quota_us", "/sys/fs/cgroup/cpu/cpu.cfs_period_us"),
+    ):
+        try:
+            fields = Path(quota_file).read_text().split()
+            if period_file is not None:
+                fields.append(Path(period_file).read_text().strip())
+            quota, period = fields[0], fields[1]
+            if quota not in ("max", "-1"):
+                cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+            break
+        except (OSError, ValueError, IndexError):
+            continue
+    return max(1, cpus)
+
+
+# Hilos de los kernels numba paralelos y de la FFT de _stft_magnitude. Un
+# NUMBA_NUM_THREADS explícito en el entorno sigue mandando si es menor.
+ANALYSIS_THREADS = min(get_num_threads(), _available_cpus())
+set_num_threads(ANALYSIS_THREADS)
+
+_MOMENTS_BLOCK = 65536  # Muestras por bloque paralelo en _signal_moments
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _signal_moments(y):
+    """
+    Una sola pasada (por bloques, en paralelo) sobre y de forma (canales, muestras).
+    Por canal: suma, suma de cuadrados y pico absoluto. Para el par L/R además
+    las energías de (L+R) y (L-R). Todo acumulado en float64. Los dos recorridos
+    de cada bloque leen los mismos 64k samples, que siguen en caché.
+    Devuelve los parciales por bloque; signal_moments() los reduce.
+    """
+    channels, n = y.shape
+    n_blocks = max(1, (n + _MOMENTS_BLOCK - 1) // _MOMENTS_BLOCK)
+    sums = np.zeros((n_blocks, channels))
+    squares = np.zeros((n_blocks, channels))
+    peaks = np.zeros((n_blocks, channels))
+    mids = np.zeros(n_blocks)
+    sides = np.zeros(n_blocks)
+    for b in prange(n_blocks):
+        start = b * _MOMENTS_BLOCK
+        end = min(start + _MOMENTS_BLOCK, n)
+        for c in range(channels):
+            acc = 0.0
+            acc_sq = 0.0
+            peak = 0.0
+            for j in range(start, end):
+                x = np.float64(y[c, j])
+                acc += x
+                acc_sq += x * x
+                ax = abs(x)
+                if ax > peak:
+                    peak = ax
+            sums[b, c] = acc
+            squares[b, c] = acc_sq
+            peaks[b, c] = peak
+        if channels >= 2:
+            acc_mid = 0.0
+            acc_side = 0.0
+            for j in range(start, end):
+                l = np.float64(y[0, j])
+                r = np.float64(y[1, j])
+                acc_mid += (l + r) * (l + r)
+                acc_side += (l - r) * (l - r)
+            mids[b] = acc_mid
+            sides[b] = acc_side
+    return sums, squares, peaks, mids, sides
+
+
+def signal_moments(y: np.ndarray) -> Dict[str, Any]:
+    """
+    Sumas de una sola pasada sobre el audio. Peak, crest factor, DC offset,
+    M/S, balance L/R, correlación y el RMS de respaldo de LUFS salen de aquí
+    como aritmética sobre unos pocos escalares, en vez de recorrer el buffer
+    completo una vez cada uno.
+    """
+    sums, squares, peaks, mids, sides = _signal_moments(y)
+    return {
+        "n": int(y.shape[1]),
+        "sum": sums.sum(axis=0),
+        "sum_sq": squares.sum(axis=0),
+        "peak": peaks.max(axis=0),
+        "mid_energy": float(mids.sum()),    # Σ(L+R)²
+        "side_energy": float(sides.sum()),  # Σ(L-R)²
+    }
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _window_moments(y, offsets, ends):
+    """
+    Lo mismo que _signal_moments pero por ventana: ventana w = muestras
+    [offsets[w], ends[w]). Las ventanas se reparten en paralelo.
+    """
+    channels = y.shape[0]
+    n_windows = offsets.size
+    sums = np.zeros((n_windows, channels))
+    squares = np.zeros((n_windows, channels))
+    peaks = np.zeros((n_windows, channels))
+    mids = np.zeros(n_windows)
+    sides = np.zeros(n_windows)
+    for w in prange(n_windows):
+        start = offsets[w]
+        end = ends[w]
+        for c in range(channels):
+            acc = 0.0
+            acc_sq = 0.0
+            peak = 0.0
+            for j in range(start, end):
+                x = np.float64(y[c, j])
+                acc += x
+                acc_sq += x * x
+                ax = abs(x)
+                if ax > peak:
+                    peak = ax
+            sums[w, c] = acc
+            squares[w, c] = acc_sq
+            peaks[w, c] = peak
+        if channels >= 2:
+            acc_mid = 0.0
+            acc_side = 0.0
+            for j in range(start, end):
+                l = np.float64(y[0, j])
+                r = np.float64(y[1, j])
+                acc_mid += (l + r) * (l + r)
+                acc_side += (l - r) * (l - r)
+            mids[w] = acc_mid
+            sides[w] = acc_side
+    return sums, squares, peaks, mids, sides
+
+
+def window_moments(y: np.ndarray, offsets: np.ndarray, ends: np.ndarray) -> Dict[str, Any]:
+    """
+    signal_moments() de muchas ventanas en una sola llamada compilada: cada
+    entrada es un array con un valor por ventana (sum, sum_sq y peak: ventanas
+    × canales). Correlación, M/S, balance L/R y pico de cada ventana salen de
+    las mismas sumas.
+    
+    Las ventanas se solapan (50%), así que no se reduce cada ventana: se reduce
+    una vez cada tramo entre bordes consecutivos y cada ventana suma sus tramos.
+    Cada muestra se lee una sola vez, sin prefijos acumulados de largo N.
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    bounds = np.union1d(offsets, ends)
+    sums, squares, peaks, mids, sides = _window_moments(y, bounds[:-1], bounds[1:])
+    if not offsets.size:
+        return {"n": ends - offsets, "sum": sums, "sum_sq": squares, "peak": peaks,
+                "mid_energy": mids, "side_energy": sides}
+    # Tramos [first, last) de cada ventana. reduceat sobre los pares intercalados
+    # suma solo esos tramos (sin restar prefijos: una ventana mono da side 0 exacto)
+    pairs = np.stack((np.searchsorted(bounds, offsets), np.searchsorted(bounds, ends)), axis=1).ravel()
+    
+    def per_window(parts: np.ndarray, reduce: np.ufunc = np.add) -> np.ndarray:
+        padded = np.concatenate((parts, np.zeros((1,) + parts.shape[1:])))
+        return reduce.reduceat(padded, pairs, axis=0)[::2]
+    
+    return {
+        "n": ends - offsets,
+        "sum": per_window(sums),
+        "sum_sq": per_window(squares),
+        "peak": per_window(peaks, np.maximum),
+        "mid_energy": per_window(mids),    # Σ(L+R)² por ventana
+        "side_energy": per_window(sides),  # Σ(L-R)² por ventana
+    }
+
+
+def _window_correlations(moments: Dict[str, Any]) -> np.ndarray:
+    """Correlación L/R de cada ventana de window_moments() (misma aritmética que stereo_correlation)."""
+    n = np.maximum(moments["n"], 1)
+    mean_l = moments["sum"][:, 0] / n
+    mean_r = moments["sum"][:, 1] / n
+    var_l = np.maximum(moments["sum_sq"][:, 0] / n - mean_l * mean_l, 0.0)
+    var_r = np.maximum(moments["sum_sq"][:, 1] / n - mean_r * mean_r, 0.0)
+    # ΣLR = (Σ(L+R)² - Σ(L-R)²) / 4
+    cov = (moments["mid_energy"] - moments["side_energy"]) / (4 * n) - mean_l * mean_r
+    corrs = np.zeros(n.size)
+    live = (var_l != 0.0) & (var_r != 0.0)  # Canal constante (silencio): covarianza nula
+    corrs[live] = cov[live] / (np.sqrt(var_l[live]) * np.sqrt(var_r[live]) + 1e-12)
+    return corrs
+
+
+def _channel_rms(moments: Dict[str, Any], ch: int) -> float:
+    """RMS de un canal a partir de signal_moments()."""
+    n = moments["n"]
+    return float(np.sqrt(moments["sum_sq"][ch] / n)) if n else 0.0
+
+
+def peak_dbfs(y: np.ndarray, moments: Optional[Dict[str, Any]] = None) -> float:
     """Pico sample en dBFS (0 dBFS = 1.0)."""
-    peak = float(np.max(np.abs(y))) if y.size else 0.0
+    if not y.size:
+        peak = 0.0
+    else:
+        if moments is None:
+            moments = signal_moments(y)
+        peak = float(moments["peak"].max())
     if peak <= 0:
         return -120.0  # Digital silence floor (standard in audio)
     try:
@@ -938,25 +1102,22 @@ def peak_dbfs(y: np.ndarray) -> float:
         return -120.0
 
 
-def detect_dc_offset(y: np.ndarray) -> Dict[str, Any]:
+def detect_dc_offset(y: np.ndarray, moments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Detect DC offset per channel."""
-    offsets = []
-    has_issue = False
+    if moments is None:
+        moments = signal_moments(y)
     
-    for ch in range(y.shape[0]):
-        offset = float(np.mean(y[ch]))
-        offsets.append(offset)
-        if abs(offset) > DC_OFFSET_THRESHOLD:
-            has_issue = True
+    offsets = moments["sum"] / moments["n"]
+    max_offset = float(np.abs(offsets).max())
     
     return {
-        "detected": has_issue,
-        "offsets": offsets,
-        "max_offset": float(max(abs(o) for o in offsets))
+        "detected": max_offset > DC_OFFSET_THRESHOLD,
+        "offsets": offsets.tolist(),
+        "max_offset": max_offset
     }
 
 
-def calculate_crest_factor(y: np.ndarray) -> float:
+def calculate_crest_factor(y: np.ndarray, moments: Optional[Dict[str, Any]] = None) -> float:
     """
     Compute crest factor (peak-to-RMS ratio) en dB.
     Útil cuando pyloudnorm no está disponible.
@@ -964,18 +1125,20 @@ def calculate_crest_factor(y: np.ndarray) -> float:
     Para estéreo, usa el peak máximo de ambos canales y RMS combinado
     (consistente con cómo se mide PLR y LUFS).
     """
+    if moments is None:
+        moments = signal_moments(y)
+    
     if y.shape[0] > 1:
         # Stereo: max peak from both channels
-        peak = float(np.max(np.abs(y)))
+        peak = float(moments["peak"].max())
         # RMS combined from both channels
-        rms_l = float(np.sqrt(np.mean(y[0].astype(np.float64) ** 2)))
-        rms_r = float(np.sqrt(np.mean(y[1].astype(np.float64) ** 2)))
+        rms_l = _channel_rms(moments, 0)
+        rms_r = _channel_rms(moments, 1)
         rms = float(np.sqrt((rms_l**2 + rms_r**2) / 2))
     else:
         # Mono
-        audio = y[0]
-        peak = float(np.max(np.abs(audio))) if audio.size else 1e-12
-        rms = float(np.sqrt(np.mean(audio.astype(np.float64) ** 2))) if audio.size else 1e-12
+        peak = float(moments["peak"][0]) if y[0].size else 1e-12
+        rms = _channel_rms(moments, 0) if y[0].size else 1e-12
     
     peak = max(peak, 1e-12)
     rms = max(rms, 1e-12)
@@ -1000,26 +1163,149 @@ def auto_oversample_factor(sr: int) -> int:
         return 4
 
 
-def oversampled_true_peak_db(y: np.ndarray, os_factor: int = 4) -> float:
-    """True peak aproximado: sobremuestreo por resample_poly y pico en dBFS."""
-    if os_factor <= 1:
-        return peak_dbfs(y)
-    
-    peaks = []
-    for ch in range(y.shape[0]):
-        up = resample_poly(y[ch], up=os_factor, down=1)
-        peaks.append(float(np.max(np.abs(up))) if up.size else 0.0)
-    
-    tp = max(max(peaks) if peaks else 0.0, 1e-12)
-    if tp <= 0:
-        return -120.0
+def _amplitude_to_db(amplitude: float) -> float:
+    """Amplitud lineal a dBFS, con el mismo piso de 1e-12 que el true peak."""
+    amplitude = max(amplitude, 1e-12)
     try:
-        return 20.0 * math.log10(tp)
+        return 20.0 * math.log10(amplitude)
     except (ValueError, ZeroDivisionError):
         return -120.0
 
 
-def integrated_lufs(y: np.ndarray, sr: int, duration: float) -> Tuple[Optional[float], str, bool]:
+_TRUE_PEAK_BLOCK = 65536  # Muestras por bloque paralelo en _true_peak_envelope
+
+
+@lru_cache(maxsize=8)
+def _true_peak_phase_taps(os_factor: int) -> Tuple[np.ndarray, float]:
+    """
+    El mismo FIR que diseña resample_poly(x, up=os_factor, down=1) (firwin con
+    Kaiser β=5, 20·os_factor+1 taps, ganancia os_factor, en float32), repartido
+    en sus os_factor fases: taps[p, k] produce la muestra p de cada grupo de
+    os_factor. La fase 0 cae sobre las muestras originales; como el corte es
+    1/os_factor el filtro tiene ceros en los múltiplos de os_factor y esa fase
+    es la muestra por el tap central, que se devuelve aparte.
+    Solo depende de os_factor, así que se diseña una vez y se comparte entre
+    chunks y archivos (array de solo lectura).
+    """
+    half_len = 10 * os_factor
+    h = firwin(2 * half_len + 1, 1.0 / os_factor, window=("kaiser", 5.0)).astype(np.float32) * os_factor
+    h = np.concatenate((h, np.zeros(os_factor - 1, dtype=np.float32)))
+    taps = np.ascontiguousarray(h.reshape(-1, os_factor).T)
+    taps.setflags(write=False)
+    return taps, float(taps[0, half_len // os_factor])
+
+
+@njit(fastmath=True, cache=True)
+def _true_peak_block(y, taps, center, out, start, end):
+    """Envolvente true peak de las muestras [start, end) (ver _true_peak_envelope)."""
+    channels, n = y.shape
+    os_factor, n_taps = taps.shape
+    reach = n_taps // 2
+    m = end - start
+    # Copia del bloque con reach muestras de contexto a cada lado (ceros fuera
+    # de la señal, como el padding de resample_poly)
+    buf = np.zeros(m + 2 * reach, dtype=np.float32)
+    lo = max(start - reach, 0)
+    hi = min(end + reach, n)
+    for i in range(m):
+        out[start + i] = 0.0
+    for c in range(channels):
+        silent = True
+        for j in range(lo, hi):
+            buf[j - start + reach] = y[c, j]
+            if y[c, j] != 0.0:
+                silent = False
+        if silent:
+            continue  # Silencio digital (intro/outro, pausas): todas las fases dan 0
+        for i in range(m):
+            best = abs(center * buf[i + reach])
+            for p in range(1, os_factor):
+                acc = np.float32(0.0)
+                for k in range(n_taps):
+                    acc += taps[p, k] * buf[i + 2 * reach - k]
+                if abs(acc) > best:
+                    best = abs(acc)
+            if best > out[start + i]:
+                out[start + i] = best
+
+
+@njit(parallel=True, cache=True)
+def _true_peak_envelope(y, taps, center, out):
+    """
+    out[i] = máximo absoluto, entre canales y entre las os_factor muestras
+    sobremuestreadas que corresponden a la muestra i, de la salida de
+    resample_poly. Se filtra por bloques en paralelo sin construir nunca la
+    señal sobremuestreada.
+    """
+    n = y.shape[1]
+    n_blocks = max(1, (n + _TRUE_PEAK_BLOCK - 1) // _TRUE_PEAK_BLOCK)
+    for b in prange(n_blocks):
+        start = b * _TRUE_PEAK_BLOCK
+        _true_peak_block(y, taps, center, out, start, min(start + _TRUE_PEAK_BLOCK, n))
+
+
+def _oversampled_abs_envelope(y: np.ndarray, os_factor: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Envolvente true peak por muestra original: para cada muestra, el máximo
+    absoluto entre canales de sus os_factor muestras sobremuestreadas. El pico
+    de cualquier tramo [a, b) de la señal sobremuestreada alineado a la muestra
+    es envelope[a:b].max(), y la envolvente ocupa N valores en vez de N·os_factor.
+    
+    `out` (float32, N valores) permite reutilizar el mismo buffer entre chunks.
+    """
+    if os_factor <= 1:
+        if not y.shape[0]:
+            return np.zeros(0, dtype=np.float32)
+        return np.abs(y).max(axis=0, out=out)
+    taps, center = _true_peak_phase_taps(os_factor)
+    envelope = np.empty(y.shape[1], dtype=np.float32) if out is None else out
+    _true_peak_envelope(y, taps, center, envelope)
+    return envelope
+
+
+def oversampled_true_peak_db(y: np.ndarray, os_factor: int = 4, envelope: Optional[np.ndarray] = None) -> float:
+    """
+    True peak aproximado: sobremuestreo (filtro de resample_poly) y pico en dBFS.
+    Si se pasa `envelope` (de _oversampled_abs_envelope con el mismo os_factor)
+    no se vuelve a sobremuestrear.
+    """
+    if os_factor <= 1:
+        return peak_dbfs(y)
+    
+    if envelope is None:
+        envelope = _oversampled_abs_envelope(y, os_factor)
+    return _amplitude_to_db(float(envelope.max()) if envelope.size else 0.0)
+
+
+def warm_up_kernels() -> None:
+    """
+    Compila (o carga del caché de numba) los kernels JIT con los tipos que
+    usan los análisis reales: float32 de 2 canales en orden C (chunks de
+    librosa.load) y en orden F (sf.read(...).T en analyze_file). Sin esto la
+    compilación, varios segundos con el caché vacío, la paga el primer análisis
+    después de cada deploy o reinicio.
+    """
+    ramp = np.linspace(-0.5, 0.5, 4096, dtype=np.float32)
+    y_c = np.stack((ramp, ramp[::-1]))
+    y_f = np.asfortranarray(y_c)
+    for y in (y_c, y_f):
+        signal_moments(y)
+        window_moments(y, np.array([0, 1024]), np.array([2048, 3072]))
+        _oversampled_abs_envelope(y, 4)
+
+
+_LOUDNESS_METERS: Dict[int, Any] = {}  # pyln.Meter por sample rate (filtros K precalculados)
+
+
+def _loudness_meter(sr: int) -> Any:
+    """Meter de pyloudnorm reutilizado por sample rate; el diseño de los filtros K se hace una sola vez."""
+    meter = _LOUDNESS_METERS.get(sr)
+    if meter is None:
+        meter = _LOUDNESS_METERS[sr] = pyln.Meter(sr)
+    return meter
+
+
+def integrated_lufs(y: np.ndarray, sr: int, duration: float, moments: Optional[Dict[str, Any]] = None) -> Tuple[Optional[float], str, bool]:
     """
     LUFS integrado real (EBU R128) si pyloudnorm está instalado.
     Retorna (lufs, method, is_reliable).
@@ -1030,7 +1316,7 @@ def integrated_lufs(y: np.ndarray, sr: int, duration: float) -> Tuple[Optional[f
     
     if HAS_PYLOUDNORM:
         try:
-            meter = pyln.Meter(sr)
+            meter = _loudness_meter(sr)
             
             # FIXED: Pass stereo audio correctly
             # pyloudnorm expects shape (samples, channels) not (channels, samples)
@@ -1041,7 +1327,8 @@ def integrated_lufs(y: np.ndarray, sr: int, duration: float) -> Tuple[Optional[f
                 # Mono: reshape from (1, samples) to (samples,)
                 audio = y[0]
             
-            lufs = float(meter.integrated_loudness(audio.astype(np.float64)))
+            # pyloudnorm ya copia la entrada: solo convertimos si no es float64
+            lufs = float(meter.integrated_loudness(np.asarray(audio, dtype=np.float64)))
             
             # pyloudnorm retorna -inf para señales muy bajas
             if not np.isfinite(lufs):
@@ -1054,15 +1341,17 @@ def integrated_lufs(y: np.ndarray, sr: int, duration: float) -> Tuple[Optional[f
     
     # fallback: RMS dBFS approx (solo informativo)
     # For stereo, calculate RMS of each channel and combine (like LUFS does)
+    if moments is None:
+        moments = signal_moments(y)
     if y.shape[0] > 1:
         # Stereo: RMS of both channels combined
-        rms_l = float(np.sqrt(np.mean(y[0].astype(np.float64) ** 2)))
-        rms_r = float(np.sqrt(np.mean(y[1].astype(np.float64) ** 2)))
+        rms_l = _channel_rms(moments, 0)
+        rms_r = _channel_rms(moments, 1)
         # Combine as energy sum (like LUFS does for multichannel)
         rms = float(np.sqrt((rms_l**2 + rms_r**2) / 2))
     else:
         # Mono
-        rms = float(np.sqrt(np.mean(y[0].astype(np.float64) ** 2)))
+        rms = _channel_rms(moments, 0)
     
     rms = max(rms, 1e-12)
     if rms <= 0:
@@ -1110,23 +1399,29 @@ def ffmpeg_integrated_lufs(filepath: str, ffmpeg_exe: str = "ffmpeg", duration:
         return None, "ffmpeg/error", False
 
 
-def stereo_correlation(y: np.ndarray) -> float:
+def stereo_correlation(y: np.ndarray, moments: Optional[Dict[str, Any]] = None) -> float:
     """Correlación L/R en [-1, 1]. Si es mono, retorna 1.0."""
     if y.shape[0] < 2:
         return 1.0
     
-    L = y[0].astype(np.float64)
-    R = y[1].astype(np.float64)
-    n = min(L.size, R.size)
+    n = min(y[0].size, y[1].size)
     
     if n < 2:
         return 1.0
     
-    L = L[:n] - np.mean(L[:n])
-    R = R[:n] - np.mean(R[:n])
-    denom = (np.std(L) * np.std(R)) + 1e-12
+    if moments is None:
+        moments = signal_moments(y)
     
-    return float(np.mean(L * R) / denom)
+    # Pearson from the whole-track sums (same arithmetic as _window_correlations)
+    mean_l = moments["sum"][0] / n
+    mean_r = moments["sum"][1] / n
+    var_l = max(moments["sum_sq"][0] / n - mean_l * mean_l, 0.0)
+    var_r = max(moments["sum_sq"][1] / n - mean_r * mean_r, 0.0)
+    if var_l == 0.0 or var_r == 0.0:
+        return 0.0
+    # ΣLR = (Σ(L+R)² - Σ(L-R)²) / 4
+    cov = (moments["mid_energy"] - moments["side_energy"]) / (4 * n) - mean_l * mean_r
+    return float(cov / (np.sqrt(var_l) * np.sqrt(var_r) + 1e-12))
 
 
 def correlation_by_band(y: np.ndarray, sr: int) -> Dict[str, float]:
@@ -1180,9 +1475,15 @@ def correlation_by_band(y: np.ndarray, sr: int) -> Dict[str, float]:
             L_filtered = sosfilt(sos, L)
             R_filtered = sosfilt(sos, R)
             
+            # Centered once; std and covariance come from BLAS dot products
+            # (no squared/product temporaries)
+            n = L_filtered.size
+            L_norm = L_filtered - L_filtered.mean()
+            R_norm = R_filtered - R_filtered.mean()
+            
             # Check if filtered signal has energy
-            L_energy = np.std(L_filtered)
-            R_energy = np.std(R_filtered)
+            L_energy = float(np.sqrt(np.dot(L_norm, L_norm) / n))
+            R_energy = float(np.sqrt(np.dot(R_norm, R_norm) / n))
 
             # v7.4.0 FIX: Return None for bands with insufficient energy instead of misleading 1.0
             if L_energy < 1e-10 or R_energy < 1e-10:
@@ -1191,10 +1492,8 @@ def correlation_by_band(y: np.ndarray, sr: int) -> Dict[str, float]:
                 continue
             
             # Calculate correlation for this band
-            L_norm = L_filtered - np.mean(L_filtered)
-            R_norm = R_filtered - np.mean(R_filtered)
-            denom = (np.std(L_norm) * np.std(R_norm)) + 1e-12
-            corr = float(np.mean(L_norm * R_norm) / denom)
+            denom = (L_energy * R_energy) + 1e-12
+            corr = float((np.dot(L_norm, R_norm) / n) / denom)
             
             # Clamp to valid range
             results[name] = max(-1.0, min(1.0, corr))
@@ -1273,7 +1572,7 @@ def identify_problem_bands(band_correlations: Dict[str, float], threshold: float
     return problems
 
 
-def calculate_ms_ratio(y: np.ndarray, debug: bool = False) -> Tuple[float, float, float]:
+def calculate_ms_ratio(y: np.ndarray, moments: Optional[Dict[str, Any]] = None) -> Tuple[float, float, float]:
     """
     Calculate Mid/Side ratio and related metrics.
     Returns: (ms_ratio, mid_rms, side_rms)
@@ -1284,27 +1583,14 @@ def calculate_ms_ratio(y: np.ndarray, debug: bool = False) -> Tuple[float, float
     if y.shape[0] < 2:
         return 0.0, 0.0, 0.0
     
-    L, R = y[0], y[1]
+    if moments is None:
+        moments = signal_moments(y)
     
-    if debug:
-        import sys
-        l_r_diff = np.abs(L - R)
-        max_diff = np.max(l_r_diff)
-        mean_diff = np.mean(l_r_diff)
-        identical_samples = np.sum(l_r_diff < 1e-9)
-        total_samples = len(L)
-        identical_percentage = (identical_samples / total_samples) * 100
-        
-    
-    # v7.4.0 FIX: Use float64 for precision
-    mid = (L.astype(np.float64) + R.astype(np.float64)) / 2
-    side = (L.astype(np.float64) - R.astype(np.float64)) / 2
-
-    mid_rms = float(np.sqrt(np.mean(mid**2)))
-    side_rms = float(np.sqrt(np.mean(side**2)))
-    
-    if debug:
-        sys.stderr.flush()
+    # v7.4.0 FIX: Use float64 for precision (the moments accumulate in float64)
+    # mid = (L+R)/2, side = (L-R)/2, so mean(mid²) = Σ(L+R)² / 4n
+    n = moments["n"]
+    mid_rms = float(np.sqrt(moments["mid_energy"] / (4 * n))) if n else 0.0
+    side_rms = float(np.sqrt(moments["side_energy"] / (4 * n))) if n else 0.0
     
     # Avoid division by zero
     ms_ratio = side_rms / (mid_rms + 1e-12) if mid_rms > 1e-9 else 0.0
@@ -1312,7 +1598,7 @@ def calculate_ms_ratio(y: np.ndarray, debug: bool = False) -> Tuple[float, float
     return ms_ratio, mid_rms, side_rms
 
 
-def calculate_lr_balance(y: np.ndarray) -> float:
+def calculate_lr_balance(y: np.ndarray, moments: Optional[Dict[str, Any]] = None) -> float:
     """
     Calculate L/R energy balance in dB.
     Returns: dB difference (positive = more left, negative = more right)
@@ -1323,8 +1609,11 @@ def calculate_lr_balance(y: np.ndarray) -> float:
     if y.shape[0] < 2:
         return 0.0
     
-    L_rms = float(np.sqrt(np.mean(y[0]**2)))
-    R_rms = float(np.sqrt(np.mean(y[1]**2)))
+    if moments is None:
+        moments = signal_moments(y)
+    
+    L_rms = _channel_rms(moments, 0)
+    R_rms = _channel_rms(moments, 1)
     
     if L_rms < 1e-9 or R_rms < 1e-9:
         return 0.0
@@ -2315,7 +2604,55 @@ def format_temporal_message(temporal_data: Dict[str, Any], parameter_name: str,
     return ""
 
 
-def analyze_true_peak_temporal(y: np.ndarray, sr: int, oversample: int = 4, threshold: float = 0.0) -> Dict[str, Any]:
+def _window_starts(n_samples: int, window_samples: int, hop_samples: int) -> np.ndarray:
+    """
+    Inicio (en muestras) de cada ventana de los análisis temporales: las mismas
+    ventanas que range(0, n_samples - window_samples, hop_samples).
+    """
+    return np.arange(0, n_samples - window_samples, hop_samples)
+
+
+def _windowed_view(x: np.ndarray, window_samples: int, hop_samples: int, n_windows: int) -> np.ndarray:
+    """
+    Vista sin copia (..., n_windows, window_samples) de las ventanas de x sobre
+    el último eje. Las reducciones sobre el último eje dan un valor por ventana.
+    """
+    if n_windows == 0:
+        return np.empty(x.shape[:-1] + (0, window_samples), dtype=x.dtype)
+    return sliding_window_view(x, window_samples, axis=-1)[..., ::hop_samples, :][..., :n_windows, :]
+
+
+def _region_bounds(times: np.ndarray, gap: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Agrupa instantes ordenados en regiones continuas: un salto mayor que `gap`
+    segundos abre una región nueva. Devuelve los índices del primer y del
+    último instante de cada región.
+    """
+    if not times.size:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+    breaks = np.flatnonzero(np.diff(times) > gap)
+    return np.concatenate(([0], breaks + 1)), np.concatenate((breaks, [times.size - 1]))
+
+
+def _regions(times: np.ndarray, gap: float) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+    """
+    Regiones de _region_bounds como (primer índice, último índice, registro).
+    El registro trae los campos comunes a todos los análisis temporales
+    (start/end formateados y en segundos); cada análisis le agrega los suyos.
+    """
+    first, last = _region_bounds(times, gap)
+    for i, j in zip(first.tolist(), last.tolist()):
+        region_start = float(times[i])
+        region_end = float(times[j])
+        yield i, j, {
+            "start": format_timestamp(region_start),
+            "end": format_timestamp(region_end),
+            "start_seconds": region_start,
+            "end_seconds": region_end
+        }
+
+
+def analyze_true_peak_temporal(y: np.ndarray, sr: int, oversample: int = 4, threshold: float = 0.0, envelope: Optional[np.ndarray] = None) -> Dict[str, Any]:
     """
     Temporal analysis of true peak.
     Detects REGIONS where true peak exceeds threshold (not just individual moments).
@@ -2325,67 +2662,42 @@ def analyze_true_peak_temporal(y: np.ndarray, sr: int, oversample: int = 4, thre
     - affected_percentage: % of track with issue
     - problem_regions: list of (start, end) timestamp pairs
     - max_value: maximum true peak found
-    """
-    # Calculate true peak for entire track
-    tp = oversampled_true_peak_db(y, os_factor=oversample)
     
+    The track is oversampled ONCE and every window reads its peak from that
+    envelope, instead of oversampling each 5 s slice again.
+    Callers that already measured the headline true peak pass that same
+    `envelope` so the track is not oversampled a second time.
+    """
     # Window-based analysis (5 second windows)
     window_duration = 5.0  # seconds
     window_samples = int(window_duration * sr)
     hop_samples = window_samples // 2  # 50% overlap
     
-    problem_windows = []
-    total_windows = 0
+    os_factor = max(1, oversample)
+    if envelope is None:
+        envelope = _oversampled_abs_envelope(y, os_factor)
     
-    for start in range(0, y.shape[1] - window_samples, hop_samples):
-        end = start + window_samples
-        window = y[:, start:end]
-        
-        window_tp = oversampled_true_peak_db(window, os_factor=oversample)
-        total_windows += 1
-        
-        timestamp = start / sr
-        
-        if window_tp > threshold:
-            problem_windows.append({
-                "time_seconds": timestamp,
-                "value": round(window_tp, 1)
-            })
+    # Calculate true peak for entire track (same value as oversampled_true_peak_db)
+    if os_factor <= 1:
+        tp = peak_dbfs(y)
+    else:
+        tp = _amplitude_to_db(float(envelope.max()) if envelope.size else 0.0)
     
-    # Now detect CONTINUOUS REGIONS from problem windows
-    problem_regions = []
+    starts = _window_starts(y.shape[1], window_samples, hop_samples)
+    total_windows = starts.size
     
-    if problem_windows:
-        current_region_start = problem_windows[0]["time_seconds"]
-        current_region_end = problem_windows[0]["time_seconds"]
-        
-        for i in range(1, len(problem_windows)):
-            prev_time = problem_windows[i-1]["time_seconds"]
-            curr_time = problem_windows[i]["time_seconds"]
-            
-            # If gap is less than 10 seconds, consider it same region
-            if curr_time - prev_time <= 10.0:
-                current_region_end = curr_time
-            else:
-                # Save previous region and start new one
-                problem_regions.append({
-                    "start": format_timestamp(current_region_start),
-                    "end": format_timestamp(current_region_end),
-                    "start_seconds": current_region_start,
-                    "end_seconds": current_region_end
-                })
-                current_region_start = curr_time
-                current_region_end = curr_time
-        
-        # Don't forget the last region
-        problem_regions.append({
-            "start": format_timestamp(current_region_start),
-            "end": format_timestamp(current_region_end),
-            "start_seconds": current_region_start,
-            "end_seconds": current_region_end
-        })
+    if total_windows > 0:
+        window_peaks = _windowed_view(envelope, window_samples, hop_samples, total_windows).max(axis=-1)
+        window_tps = 20.0 * np.log10(np.maximum(window_peaks, 1e-12))
+        problem_idx = np.flatnonzero(window_tps > threshold)
+    else:
+        problem_idx = np.empty(0, dtype=np.intp)
     
-    affected_percentage = (len(problem_windows) / total_windows * 100) if total_windows > 0 else 0
+    # Now detect CONTINUOUS REGIONS from problem windows
+    # If gap is less than 10 seconds, consider it same region
+    problem_regions = [region for _, _, region in _regions(starts[problem_idx] / sr, 10.0)]
+    
+    affected_percentage = (problem_idx.size / total_windows * 100) if total_windows > 0 else 0
     severity = "widespread" if affected_percentage >= 20 else "localized"
     
     return {
@@ -2402,10 +2714,11 @@ def analyze_clipping_temporal(y: np.ndarray, sr: int, threshold: float = 0.99999
     Temporal analysis of clipping.
     Detects REGIONS where samples clip (not just individual moments).
     """
-    # Find clipped samples
-    clipped_samples = np.where(np.abs(y) >= threshold)[1]
+    # Find clipped samples (per channel for the percentage, across channels for timing)
+    clipped = np.abs(y) >= threshold
+    clipped_count = int(np.count_nonzero(clipped))
     
-    if len(clipped_samples) == 0:
+    if clipped_count == 0:
         return {
             "severity": "none",
             "affected_percentage": 0.0,
@@ -2413,53 +2726,40 @@ def analyze_clipping_temporal(y: np.ndarray, sr: int, threshold: float = 0.99999
             "total_regions": 0
         }
     
-    # Group clipped samples into moments (within 0.1s of each other)
-    problem_moments = []
-    last_time = -999
-    
-    for sample_idx in clipped_samples:
-        time_seconds = sample_idx / sr
-        
-        # Only add if it's a new moment (>0.1s from last)
-        if time_seconds - last_time > 0.1:
-            problem_moments.append({"time_seconds": time_seconds})
-            last_time = time_seconds
+    # Runs of clipped samples [run_starts[r], run_ends[r]) across channels:
+    # two indices per run instead of one per clipped sample
+    edges = np.flatnonzero(np.diff(clipped.any(axis=0), prepend=False, append=False))
+    run_starts, run_ends = edges[0::2], edges[1::2]
+    
+    # Group clipped samples into moments (within 0.1s of each other).
+    # A moment is anchored at its first sample, so the scan hops from moment to
+    # moment over the runs instead of visiting every clipped sample.
+    moment_times = []
+    hop = int(0.1 * sr)
+    i = int(run_starts[0])
+    while True:
+        last_time = i / sr
+        moment_times.append(last_time)
+        # First sample with time_seconds - last_time > 0.1, tested exactly as written
+        # (continuous clipping lands right on the 0.1 s boundary)
+        j = i + hop
+        while j > i + 1 and (j - 1) / sr - last_time > 0.1:
+            j -= 1
+        while not (j / sr - last_time > 0.1):
+            j += 1
+        # Next clipped sample at or after j: j itself or the start of the next run
+        r = int(np.searchsorted(run_ends, j, side='right'))
+        if r == run_ends.size:
+            break
+        i = max(j, int(run_starts[r]))
+    moment_times = np.asarray(moment_times)
     
     # Now detect CONTINUOUS REGIONS from problem moments
-    problem_regions = []
-    
-    if problem_moments:
-        current_region_start = problem_moments[0]["time_seconds"]
-        current_region_end = problem_moments[0]["time_seconds"]
-        
-        for i in range(1, len(problem_moments)):
-            prev_time = problem_moments[i-1]["time_seconds"]
-            curr_time = problem_moments[i]["time_seconds"]
-            
-            # If gap is less than 5 seconds, consider it same region (shorter for clipping)
-            if curr_time - prev_time <= 5.0:
-                current_region_end = curr_time
-            else:
-                # Save previous region and start new one
-                problem_regions.append({
-                    "start": format_timestamp(current_region_start),
-                    "end": format_timestamp(current_region_end),
-                    "start_seconds": current_region_start,
-                    "end_seconds": current_region_end
-                })
-                current_region_start = curr_time
-                current_region_end = curr_time
-        
-        # Don't forget the last region
-        problem_regions.append({
-            "start": format_timestamp(current_region_start),
-            "end": format_timestamp(current_region_end),
-            "start_seconds": current_region_start,
-            "end_seconds": current_region_end
-        })
+    # If gap is less than 5 seconds, consider it same region (shorter for clipping)
+    problem_regions = [region for _, _, region in _regions(moment_times, 5.0)]
     
     total_samples = y.shape[1]
-    affected_percentage = (len(clipped_samples) / total_samples * 100)
+    affected_percentage = (clipped_count / total_samples * 100)
     severity = "widespread" if affected_percentage >= 1.0 else "localized"
     
     return {
@@ -2470,7 +2770,14 @@ def analyze_clipping_temporal(y: np.ndarray, sr: int, threshold: float = 0.99999
     }
 
 
-def analyze_correlation_temporal(y: np.ndarray, sr: int, threshold: float = 0.5) -> Dict[str, Any]:
+def _temporal_window_moments(y: np.ndarray, sr: int) -> Dict[str, Any]:
+    """window_moments() de L/R sobre la rejilla de los análisis temporales estéreo (ventanas de 5 s, 50% de solape)."""
+    window_samples = int(5.0 * sr)
+    starts = _window_starts(y.shape[1], window_samples, window_samples // 2)
+    return window_moments(y[:2], starts, starts + window_samples)
+
+
+def analyze_correlation_temporal(y: np.ndarray, sr: int, threshold: float = 0.5, moments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Temporal analysis of stereo correlation.
     Detects REGIONS where correlation is problematic (not just individual moments).
@@ -2480,6 +2787,9 @@ def analyze_correlation_temporal(y: np.ndarray, sr: int, threshold: float = 0.5)
     v7.3.30: Added filtering for:
     - Regions < 8 seconds (noise)
     - Intro (first 5s) and outro (last 5s)
+    
+    `moments` (from _temporal_window_moments) lets the three stereo temporal
+    analyzers share one pass over the windows.
     """
     if y.shape[0] < 2:
         return {"severity": "none", "affected_percentage": 0.0, "problem_regions": [], "total_regions": 0}
@@ -2493,96 +2803,46 @@ def analyze_correlation_temporal(y: np.ndarray, sr: int, threshold: float = 0.5)
     hop_samples = window_samples // 2
     
     problem_windows = []
-    total_windows = 0
-    min_corr = 1.0
     
-    for start in range(0, y.shape[1] - window_samples, hop_samples):
-        end = start + window_samples
-        window = y[:, start:end]
-        
-        corr = stereo_correlation(window)
-        total_windows += 1
-        
-        if corr < min_corr:
-            min_corr = corr
-        
-        timestamp = start / sr
-        
-        if corr < threshold:
-            # v7.3.36: Calculate band correlation for problem windows
-            band_corr = None
-            if corr < 0.3:  # Only for significant issues
-                band_corr = correlation_by_band(window, sr)
-            
-            problem_windows.append({
-                "time_seconds": timestamp,
-                "value": round(corr * 100, 0),
-                "correlation": corr,
-                "band_correlation": band_corr
-            })
+    # Correlation of every window from the shared per-window sums
+    starts = _window_starts(y.shape[1], window_samples, hop_samples)
+    total_windows = starts.size
+    if moments is None:
+        moments = _temporal_window_moments(y, sr)
+    window_corrs = _window_correlations(moments)
+    min_corr = min(1.0, float(window_corrs.min())) if total_windows > 0 else 1.0
+    
+    # Timestamps of the problem windows in one vectorized division
+    problem_idx = np.flatnonzero(window_corrs < threshold)
+    times = starts[problem_idx] / sr
+    
+    for w, timestamp in zip(problem_idx.tolist(), times.tolist()):
+        start = int(starts[w])
+        corr = float(window_corrs[w])
+        
+        # v7.3.36: Calculate band correlation for problem windows
+        band_corr = None
+        if corr < 0.3:  # Only for significant issues
+            band_corr = correlation_by_band(y[:, start:start + window_samples], sr)
+        
+        problem_windows.append({
+            "time_seconds": timestamp,
+            "value": round(corr * 100, 0),
+            "correlation": corr,
+            "band_correlation": band_corr
+        })
     
     # Now detect CONTINUOUS REGIONS from problem windows
+    # If gap is less than 10 seconds, consider it same region
     problem_regions = []
-    
-    if problem_windows:
-        current_region_start = problem_windows[0]["time_seconds"]
-        current_region_end = problem_windows[0]["time_seconds"]
-        current_region_windows = [problem_windows[0]]
+    for first, last, region in _regions(times, 10.0):
+        region_windows = problem_windows[first:last + 1]
         
-        for i in range(1, len(problem_windows)):
-            prev_time = problem_windows[i-1]["time_seconds"]
-            curr_time = problem_windows[i]["time_seconds"]
-            
-            # If gap is less than 10 seconds, consider it same region
-            if curr_time - prev_time <= 10.0:
-                current_region_end = curr_time
-                current_region_windows.append(problem_windows[i])
-            else:
-                # Save previous region and start new one
-                # v7.3.36: Calculate average correlation and band_correlation for region
-                avg_corr = sum(w['correlation'] for w in current_region_windows) / len(current_region_windows)
-                
-                # Aggregate band correlations
-                band_corrs = [w.get('band_correlation') for w in current_region_windows if w.get('band_correlation')]
-                avg_band_corr = None
-                if band_corrs:
-                    avg_band_corr = {}
-                    for band in ['sub_bass', 'bass_mid', 'mid', 'mid_high', 'high']:
-                        values = [bc[band] for bc in band_corrs if band in bc and bc[band] is not None]
-                        if values:
-                            avg_band_corr[band] = sum(values) / len(values)
-                
-                # v7.3.51: Classify issue type - only < 0.5 is reported
-                # High correlation is NOT a problem
-                if avg_corr >= 0.5:
-                    issue_type = 'healthy'  # Won't be included in report
-                elif avg_corr >= 0.3 and avg_corr < 0.5:
-                    issue_type = 'medium_low'
-                elif avg_corr >= 0.0 and avg_corr < 0.3:
-                    issue_type = 'very_low'
-                elif avg_corr >= -0.2 and avg_corr < 0.0:
-                    issue_type = 'negative'
-                else:
-                    issue_type = 'negative_severe'
-                
-                problem_regions.append({
-                    "start": format_timestamp(current_region_start),
-                    "end": format_timestamp(current_region_end),
-                    "start_seconds": current_region_start,
-                    "end_seconds": current_region_end,
-                    "avg_correlation": avg_corr,
-                    "issue": issue_type,
-                    "band_correlation": avg_band_corr
-                })
-                current_region_start = curr_time
-                current_region_end = curr_time
-                current_region_windows = [problem_windows[i]]
-        
-        # Don't forget the last region
-        avg_corr = sum(w['correlation'] for w in current_region_windows) / len(current_region_windows)
+        # v7.3.36: Calculate average correlation and band_correlation for region
+        avg_corr = sum(w['correlation'] for w in region_windows) / len(region_windows)
         
-        # Aggregate band correlations for last region
-        band_corrs = [w.get('band_correlation') for w in current_region_windows if w.get('band_correlation')]
+        # Aggregate band correlations
+        band_corrs = [w.get('band_correlation') for w in region_windows if w.get('band_correlation')]
         avg_band_corr = None
         if band_corrs:
             avg_band_corr = {}
@@ -2592,6 +2852,7 @@ def analyze_correlation_temporal(y: np.ndarray, sr: int, threshold: float = 0.5)
                     avg_band_corr[band] = sum(values) / len(values)
         
         # v7.3.51: Classify issue type - only < 0.5 is reported
+        # High correlation is NOT a problem
         if avg_corr >= 0.5:
             issue_type = 'healthy'  # Won't be included in report
         elif avg_corr >= 0.3 and avg_corr < 0.5:
@@ -2603,15 +2864,12 @@ def analyze_correlation_temporal(y: np.ndarray, sr: int, threshold: float = 0.5)
         else:
             issue_type = 'negative_severe'
         
-        problem_regions.append({
-            "start": format_timestamp(current_region_start),
-            "end": format_timestamp(current_region_end),
-            "start_seconds": current_region_start,
-            "end_seconds": current_region_end,
+        region.update({
             "avg_correlation": avg_corr,
             "issue": issue_type,
             "band_correlation": avg_band_corr
         })
+        problem_regions.append(region)
     
     # v7.3.51: Filter out 'healthy' regions (correlation >= 0.5 is not a problem)
     problem_regions = [r for r in problem_regions if r.get('issue') != 'healthy']
@@ -2635,7 +2893,7 @@ def analyze_correlation_temporal(y: np.ndarray, sr: int, threshold: float = 0.5)
     }
 
 
-def analyze_lr_balance_temporal(y: np.ndarray, sr: int, threshold: float = 3.0) -> Dict[str, Any]:
+def analyze_lr_balance_temporal(y: np.ndarray, sr: int, threshold: float = 3.0, moments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Temporal analysis of L/R balance.
     Detects REGIONS where balance exceeds threshold (not just individual moments).
@@ -2644,6 +2902,8 @@ def analyze_lr_balance_temporal(y: np.ndarray, sr: int, threshold: float = 3.0)
     v7.3.30: Added filtering for:
     - Regions < 8 seconds (noise)
     - Intro (first 5s) and outro (last 5s)
+    
+    `moments`: shared per-window sums, see analyze_correlation_temporal.
     """
     if y.shape[0] < 2:
         return {"severity": "none", "affected_percentage": 0.0, "problem_regions": [], "total_regions": 0}
@@ -2657,78 +2917,53 @@ def analyze_lr_balance_temporal(y: np.ndarray, sr: int, threshold: float = 3.0)
     hop_samples = window_samples // 2
     
     problem_windows = []
-    total_windows = 0
     max_imbalance = 0.0
     
-    for start in range(0, y.shape[1] - window_samples, hop_samples):
-        end = start + window_samples
-        window = y[:, start:end]
-        
-        balance = calculate_lr_balance(window)
-        total_windows += 1
-        
-        if abs(balance) > abs(max_imbalance):
-            max_imbalance = balance
-        
-        timestamp = start / sr
-        
-        if abs(balance) > threshold:
-            problem_windows.append({
-                "time_seconds": timestamp,
-                "value": round(balance, 1),
-                "balance_db": balance,
-                "side": "left" if balance > 0 else "right",
-                "severity": "critical" if abs(balance) > 3.0 else "warning"
-            })
+    # Per-window channel energy, every sample read once (float64 accumulation)
+    starts = _window_starts(y.shape[1], window_samples, hop_samples)
+    total_windows = starts.size
+    if moments is None:
+        moments = _temporal_window_moments(y, sr)
+    rms = np.sqrt(moments["sum_sq"].T / window_samples)
+    
+    # Same as calculate_lr_balance on each window
+    silent = (rms[0] < 1e-9) | (rms[1] < 1e-9)
+    balances = np.zeros(total_windows)
+    balances[~silent] = 20 * np.log10(rms[0, ~silent] / rms[1, ~silent])
+    
+    if total_windows > 0:
+        loudest = int(np.argmax(np.abs(balances)))
+        if abs(balances[loudest]) > 0.0:
+            max_imbalance = float(balances[loudest])
+    
+    problem_idx = np.flatnonzero(np.abs(balances) > threshold)
+    times = starts[problem_idx] / sr
+    
+    for w, timestamp in zip(problem_idx.tolist(), times.tolist()):
+        balance = float(balances[w])
+        problem_windows.append({
+            "time_seconds": timestamp,
+            "value": round(balance, 1),
+            "balance_db": balance,
+            "side": "left" if balance > 0 else "right",
+            "severity": "critical" if abs(balance) > 3.0 else "warning"
+        })
     
     # Now detect CONTINUOUS REGIONS from problem windows
+    # If gap is less than 10 seconds, consider it same region
     problem_regions = []
-    
-    if problem_windows:
-        current_region_start = problem_windows[0]["time_seconds"]
-        current_region_end = problem_windows[0]["time_seconds"]
-        current_region_windows = [problem_windows[0]]
+    _sev_rank = {'ok': 0, 'warning': 1, 'critical': 2}
+    for first, last, region in _regions(times, 10.0):
+        region_windows = problem_windows[first:last + 1]
+        avg_balance = sum(w['balance_db'] for w in region_windows) / len(region_windows)
+        max_severity = max((w['severity'] for w in region_windows), key=lambda s: _sev_rank.get(s, 0))
         
-        for i in range(1, len(problem_windows)):
-            prev_time = problem_windows[i-1]["time_seconds"]
-            curr_time = problem_windows[i]["time_seconds"]
-            
-            # If gap is less than 10 seconds, consider it same region
-            if curr_time - prev_time <= 10.0:
-                current_region_end = curr_time
-                current_region_windows.append(problem_windows[i])
-            else:
-                # Save previous region and start new one
-                avg_balance = sum(w['balance_db'] for w in current_region_windows) / len(current_region_windows)
-                _sev_rank = {'ok': 0, 'warning': 1, 'critical': 2}
-                max_severity = max((w['severity'] for w in current_region_windows), key=lambda s: _sev_rank.get(s, 0))
-
-                problem_regions.append({
-                    "start": format_timestamp(current_region_start),
-                    "end": format_timestamp(current_region_end),
-                    "start_seconds": current_region_start,
-                    "end_seconds": current_region_end,
-                    "avg_balance_db": avg_balance,
-                    "side": "left" if avg_balance > 0 else "right",
-                    "severity": max_severity
-                })
-                current_region_start = curr_time
-                current_region_end = curr_time
-                current_region_windows = [problem_windows[i]]
-
-        # Don't forget the last region
-        avg_balance = sum(w['balance_db'] for w in current_region_windows) / len(current_region_windows)
-        max_severity = max((w['severity'] for w in current_region_windows), key=lambda s: _sev_rank.get(s, 0))
-        
-        problem_regions.append({
-            "start": format_timestamp(current_region_start),
-            "end": format_timestamp(current_region_end),
-            "start_seconds": current_region_start,
-            "end_seconds": current_region_end,
+        region.update({
             "avg_balance_db": avg_balance,
             "side": "left" if avg_balance > 0 else "right",
             "severity": max_severity
         })
+        problem_regions.append(region)
     
     # v7.3.30: Filter regions (min duration 8s, exclude intro/outro 5s)
     problem_regions = filter_temporal_regions(problem_regions, track_duration)
@@ -2749,7 +2984,7 @@ def analyze_lr_balance_temporal(y: np.ndarray, sr: int, threshold: float = 3.0)
     }
 
 
-def analyze_ms_ratio_temporal(y: np.ndarray, sr: int, low_threshold: float = 0.05, high_threshold: float = 1.5) -> Dict[str, Any]:
+def analyze_ms_ratio_temporal(y: np.ndarray, sr: int, low_threshold: float = 0.05, high_threshold: float = 1.5, moments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Temporal analysis of M/S ratio.
     Detects REGIONS where M/S ratio is problematic (too low or too high).
@@ -2758,6 +2993,8 @@ def analyze_ms_ratio_temporal(y: np.ndarray, sr: int, low_threshold: float = 0.0
     v7.3.30: Added filtering for:
     - Regions < 8 seconds (noise)
     - Intro (first 5s) and outro (last 5s)
+    
+    `moments`: shared per-window sums, see analyze_correlation_temporal.
     """
     if y.shape[0] < 2:
         return {"severity": "none", "affected_percentage": 0.0, "problem_regions": [], "total_regions": 0}
@@ -2771,83 +3008,53 @@ def analyze_ms_ratio_temporal(y: np.ndarray, sr: int, low_threshold: float = 0.0
     hop_samples = window_samples // 2
     
     problem_windows = []
-    total_windows = 0
     min_ms = 999.0
     max_ms = 0.0
     
-    for start in range(0, y.shape[1] - window_samples, hop_samples):
-        end = start + window_samples
-        window = y[:, start:end]
-        
-        ms_ratio, _, _ = calculate_ms_ratio(window)
-        total_windows += 1
-        
-        if ms_ratio < min_ms:
-            min_ms = ms_ratio
-        if ms_ratio > max_ms:
-            max_ms = ms_ratio
-        
-        is_problem = ms_ratio < low_threshold or ms_ratio > high_threshold
-        
-        timestamp = start / sr
-        
-        if is_problem:
-            problem_type = "mono" if ms_ratio < low_threshold else "too_wide"
-            problem_windows.append({
-                "time_seconds": timestamp,
-                "value": round(ms_ratio, 2),
-                "ms_ratio": ms_ratio,
-                "issue": problem_type,
-                "severity": "warning"
-            })
+    # Per-window Σ(L+R)² and Σ(L-R)², every sample read once (float64
+    # accumulation), so no mid/side arrays are built
+    starts = _window_starts(y.shape[1], window_samples, hop_samples)
+    total_windows = starts.size
+    if moments is None:
+        moments = _temporal_window_moments(y, sr)
+    
+    # Same as calculate_ms_ratio on each window
+    mid_rms = np.sqrt(moments["mid_energy"] / (4 * window_samples))
+    side_rms = np.sqrt(moments["side_energy"] / (4 * window_samples))
+    ms_ratios = np.where(mid_rms > 1e-9, side_rms / (mid_rms + 1e-12), 0.0)
+    
+    if total_windows > 0:
+        min_ms = min(min_ms, float(ms_ratios.min()))
+        max_ms = max(max_ms, float(ms_ratios.max()))
+    
+    problem_idx = np.flatnonzero((ms_ratios < low_threshold) | (ms_ratios > high_threshold))
+    times = starts[problem_idx] / sr
+    
+    for w, timestamp in zip(problem_idx.tolist(), times.tolist()):
+        ms_ratio = float(ms_ratios[w])
+        problem_type = "mono" if ms_ratio < low_threshold else "too_wide"
+        problem_windows.append({
+            "time_seconds": timestamp,
+            "value": round(ms_ratio, 2),
+            "ms_ratio": ms_ratio,
+            "issue": problem_type,
+            "severity": "warning"
+        })
     
     # Now detect CONTINUOUS REGIONS from problem windows
+    # If gap is less than 10 seconds, consider it same region
     problem_regions = []
-    
-    if problem_windows:
-        current_region_start = problem_windows[0]["time_seconds"]
-        current_region_end = problem_windows[0]["time_seconds"]
-        current_region_windows = [problem_windows[0]]
+    for first, last, region in _regions(times, 10.0):
+        region_windows = problem_windows[first:last + 1]
+        avg_ms = sum(w['ms_ratio'] for w in region_windows) / len(region_windows)
+        issue_type = region_windows[0]['issue']  # Use first window's issue type
         
-        for i in range(1, len(problem_windows)):
-            prev_time = problem_windows[i-1]["time_seconds"]
-            curr_time = problem_windows[i]["time_seconds"]
-            
-            # If gap is less than 10 seconds, consider it same region
-            if curr_time - prev_time <= 10.0:
-                current_region_end = curr_time
-                current_region_windows.append(problem_windows[i])
-            else:
-                # Save previous region and start new one
-                avg_ms = sum(w['ms_ratio'] for w in current_region_windows) / len(current_region_windows)
-                issue_type = current_region_windows[0]['issue']  # Use first window's issue type
-                
-                problem_regions.append({
-                    "start": format_timestamp(current_region_start),
-                    "end": format_timestamp(current_region_end),
-                    "start_seconds": current_region_start,
-                    "end_seconds": current_region_end,
-                    "avg_ms_ratio": avg_ms,
-                    "issue": issue_type,
-                    "severity": "warning"
-                })
-                current_region_start = curr_time
-                current_region_end = curr_time
-                current_region_windows = [problem_windows[i]]
-        
-        # Don't forget the last region
-        avg_ms = sum(w['ms_ratio'] for w in current_region_windows) / len(current_region_windows)
-        issue_type = current_region_windows[0]['issue']
-        
-        problem_regions.append({
-            "start": format_timestamp(current_region_start),
-            "end": format_timestamp(current_region_end),
-            "start_seconds": current_region_start,
-            "end_seconds": current_region_end,
+        region.update({
             "avg_ms_ratio": avg_ms,
             "issue": issue_type,
             "severity": "warning"
         })
+        problem_regions.append(region)
     
     # v7.3.30: Filter regions (min duration 8s, exclude intro/outro 5s)
     problem_regions = filter_temporal_regions(problem_regions, track_duration)
@@ -2869,6 +3076,33 @@ def analyze_ms_ratio_temporal(y: np.ndarray, sr: int, low_threshold: float = 0.0
     }
 
 
+# Textos de contexto de evaluate_stereo_field_comprehensive, por idioma
+_STEREO_CTX_MSGS = {
+    "en": {
+        "mono": "⚠️ Mix has no stereo information (practically mono). Is this intentional? Check if you exported in mono by mistake.",
+        "very_centered": "ℹ️ Very centered mix (corr: {corr:.2f}, M/S: {ms_ratio:.2f}). Mono content predominates with subtle stereo.",
+        "centered": "ℹ️ Centered stereo image (corr: {corr:.2f}, M/S: {ms_ratio:.2f}). Good mono compatibility with stereo information present.",
+        "too_wide": "⚠️ Very wide stereo (M/S: {ms_ratio:.2f}). May sound weak on speakers or mono. Consider reducing stereo widening.",
+        "lr_imbalance": "⚠️ L/R imbalance: {imbalance:.1f} dB more energy in {side} channel. Check panning and channel volumes.",
+        "left": "left",
+        "right": "right",
+        "strict_summary": " M/S Ratio: {ms_ratio:.2f} (commercial range: 0.3-0.7), L/R Balance: {lr} dB (professional tolerance: ±3 dB).",
+        "summary": " M/S Ratio: {ms_ratio:.2f} (balanced), L/R Balance: {lr} dB (centered).",
+    },
+    "es": {
+        "mono": "⚠️ La mezcla no tiene información estéreo (prácticamente mono). ¿Es intencional? Conviene verificar si se exportó en mono por error.",
+        "very_centered": "ℹ️ Mezcla muy centrada (corr: {corr:.2f}, M/S: {ms_ratio:.2f}). Predomina contenido mono con estéreo sutil.",
+        "centered": "ℹ️ Imagen estéreo centrada (corr: {corr:.2f}, M/S: {ms_ratio:.2f}). Buena mono-compatibilidad con información estéreo presente.",
+        "too_wide": "⚠️ Estéreo muy ancho (M/S: {ms_ratio:.2f}). Puede sonar débil en parlantes o mono. Conviene reducir el ensanchamiento estéreo.",
+        "lr_imbalance": "⚠️ Desbalance L/R: {imbalance:.1f} dB más energía en canal {side}. Conviene verificar paneo y volumen de canales.",
+        "left": "izquierdo",
+        "right": "derecho",
+        "strict_summary": " Relación M/S: {ms_ratio:.2f} (rango comercial: 0.3-0.7), Balance L/R: {lr} dB (tolerancia profesional: ±3 dB).",
+        "summary": " Relación M/S: {ms_ratio:.2f} (balanceado), Balance L/R: {lr} dB (centrado).",
+    },
+}
+
+
 def evaluate_stereo_field_comprehensive(corr: float, ms_ratio: float, lr_balance: float, lang: str = 'en', strict: bool = False) -> Tuple[str, str]:
     """
     Comprehensive stereo field evaluation considering:
@@ -2884,10 +3118,20 @@ def evaluate_stereo_field_comprehensive(corr: float, ms_ratio: float, lr_balance
     would newly activate the stricter stereo bands on existing strict users.
     """
     lang = _pick_lang(lang)
+    msgs = _STEREO_CTX_MSGS[lang]
 
     # Get base correlation status and message
-    base_status, base_message, _ = _status_stereo_en(corr) if lang == 'en' else _status_stereo_es(corr)
+    base_status, base_message, _ = _STATUS_STEREO[lang](corr)
     
+    ms_bad = ms_ratio < 0.05 or ms_ratio > 1.5
+    lr_bad = abs(lr_balance) > 3.0
+
+    if not (ms_bad or lr_bad):
+        # Caso común (campo estéreo sano): solo el resumen M/S y L/R,
+        # con los estándares comerciales en modo strict
+        summary = msgs["strict_summary"] if strict else msgs["summary"]
+        return base_status, base_message + summary.format(ms_ratio=ms_ratio, lr=_fmt_lr(lr_balance))
+
     # Build additional context
     context_parts = []
     
@@ -2896,57 +3140,83 @@ def evaluate_stereo_field_comprehensive(corr: float, ms_ratio: float, lr_balance
         # M/S ratio muy bajo sugiere poca información Side, PERO debemos considerar correlación también
         # CORRELACIÓN: +1.0 = mono puro, 0.97-1.0 = casi mono, 0.7-0.95 = estéreo saludable
         if corr > 0.97:  # Solo si correlación es MUY alta (>97%) = verdaderamente mono
-            if lang == 'es':
-                context_parts.append("⚠️ La mezcla no tiene información estéreo (prácticamente mono). ¿Es intencional? Conviene verificar si se exportó en mono por error.")
-            else:
-                context_parts.append("⚠️ Mix has no stereo information (practically mono). Is this intentional? Check if you exported in mono by mistake.")
+            context_parts.append(msgs["mono"])
         elif corr > 0.90:
             # Correlación muy alta pero no extrema = muy centrado
-            if lang == 'es':
-                context_parts.append(f"ℹ️ Mezcla muy centrada (corr: {corr:.2f}, M/S: {ms_ratio:.2f}). Predomina contenido mono con estéreo sutil.")
-            else:
-                context_parts.append(f"ℹ️ Very centered mix (corr: {corr:.2f}, M/S: {ms_ratio:.2f}). Mono content predominates with subtle stereo.")
+            context_parts.append(msgs["very_centered"].format(corr=corr, ms_ratio=ms_ratio))
         else:
             # Correlación moderada (70-90%) pero M/S bajo = estéreo centrado pero presente
-            if lang == 'es':
-                context_parts.append(f"ℹ️ Imagen estéreo centrada (corr: {corr:.2f}, M/S: {ms_ratio:.2f}). Buena mono-compatibilidad con información estéreo presente.")
-            else:
-                context_parts.append(f"ℹ️ Centered stereo image (corr: {corr:.2f}, M/S: {ms_ratio:.2f}). Good mono compatibility with stereo information present.")
-    elif ms_ratio > 1.5:
-        if lang == 'es':
-            context_parts.append(f"⚠️ Estéreo muy ancho (M/S: {ms_ratio:.2f}). Puede sonar débil en parlantes o mono. Conviene reducir el ensanchamiento estéreo.")
-        else:
-            context_parts.append(f"⚠️ Very wide stereo (M/S: {ms_ratio:.2f}). May sound weak on speakers or mono. Consider reducing stereo widening.")
+            context_parts.append(msgs["centered"].format(corr=corr, ms_ratio=ms_ratio))
+    elif ms_bad:
+        context_parts.append(msgs["too_wide"].format(ms_ratio=ms_ratio))
     
     # Check L/R Balance
-    if abs(lr_balance) > 3.0:
-        side = "izquierdo" if lr_balance > 0 else "derecho" if lang == 'es' else "left" if lr_balance > 0 else "right"
-        if lang == 'es':
-            context_parts.append(f"⚠️ Desbalance L/R: {abs(lr_balance):.1f} dB más energía en canal {side}. Conviene verificar paneo y volumen de canales.")
-        else:
-            context_parts.append(f"⚠️ L/R imbalance: {abs(lr_balance):.1f} dB more energy in {side} channel. Check panning and channel volumes.")
+    if lr_bad:
+        side = msgs["left"] if lr_balance > 0 else msgs["right"]
+        context_parts.append(msgs["lr_imbalance"].format(imbalance=abs(lr_balance), side=side))
     
-    # Combine base message with context
-    if context_parts:
-        enhanced_message = base_message + "\n\n" + "\n".join(context_parts)
-    else:
-        # Add M/S and LR info - with commercial standards in strict mode
-        if strict:
-            if lang == 'es':
-                enhanced_message = (base_message + 
-                    f" Relación M/S: {ms_ratio:.2f} (rango comercial: 0.3-0.7), "
-                    f"Balance L/R: {_fmt_lr(lr_balance)} dB (tolerancia profesional: ±3 dB).")
-            else:
-                enhanced_message = (base_message + 
-                    f" M/S Ratio: {ms_ratio:.2f} (commercial range: 0.3-0.7), "
-                    f"L/R Balance: {_fmt_lr(lr_balance)} dB (professional tolerance: ±3 dB).")
-        else:
-            if lang == 'es':
-                enhanced_message = base_message + f" Relación M/S: {ms_ratio:.2f} (balanceado), Balance L/R: {_fmt_lr(lr_balance)} dB (centrado)."
-            else:
-                enhanced_message = base_message + f" M/S Ratio: {ms_ratio:.2f} (balanced), L/R Balance: {_fmt_lr(lr_balance)} dB (centered)."
+    return base_status, base_message + "\n\n" + "\n".join(context_parts)
+
+
+_STFT_BLOCK_FRAMES = 64  # Frames por bloque de FFT en _stft_magnitude (~4 MB con n_fft=8192)
+
+
+@lru_cache(maxsize=8)
+def _hann_window(n_fft: int) -> np.ndarray:
+    """Ventana Hann periódica de n_fft muestras (la misma que usa librosa.stft)."""
+    return get_window("hann", n_fft, fftbins=True)
+
+
+def _stft_magnitude(audio: np.ndarray, n_fft: int, hop: int) -> np.ndarray:
+    """
+    |STFT| de forma (bins, frames), idéntica a
+    np.abs(librosa.stft(audio, n_fft=n_fft, hop_length=hop, window="hann", center=True)):
+    padding de ceros de n_fft//2 a cada lado y frames leídos como vistas.
+    La FFT se hace por bloques de frames, así que la matriz compleja completa
+    (16 bytes por bin y frame) nunca existe; solo se guarda la magnitud.
+    Cada bloque reparte sus frames entre ANALYSIS_THREADS hilos; las FFT por
+    fila son independientes, así que el resultado no cambia.
+    """
+    padded = np.pad(audio, n_fft // 2)
+    frames = sliding_window_view(padded, n_fft)[::hop]
+    window = _hann_window(n_fft)
+    magnitude = np.empty((n_fft // 2 + 1, frames.shape[0]))
+    for start in range(0, frames.shape[0], _STFT_BLOCK_FRAMES):
+        block = frames[start:start + _STFT_BLOCK_FRAMES]
+        magnitude[:, start:start + block.shape[0]] = np.abs(sp_fft.rfft(block * window, axis=-1, workers=ANALYSIS_THREADS)).T
+    return magnitude
+
+
+@lru_cache(maxsize=16)
+def _band_geometry(sr: int, n_fft: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Frecuencias de los bins y curva K-weighting de band_balance_db. Solo
+    dependen de (sr, n_fft), así que se calculan una vez y se comparten entre
+    chunks y archivos (arrays de solo lectura).
+    """
+    freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
+    
+    # Aplicar K-weighting (ITU-R BS.1770 simplificado)
+    #Highpass ~38 Hz + Highshelf ~1.5kHz
+    # (vectorizado sobre los bins; el bin DC queda con peso 1)
+    f2 = freqs**2
+    positive = freqs > 0
     
-    return base_status, enhanced_message
+    # Stage 1: Highpass filter (shelf at ~38 Hz)
+    f_hp = 38.0
+    # Simplified highpass response
+    hp_gain = np.where(positive, f2 / (f2 + f_hp**2), 1.0)
+    
+    # Stage 2: High-frequency shelf boost (~+4dB at 1.5kHz and above)
+    f_shelf = 1500.0
+    # Simplified high shelf
+    shelf_gain = np.where(positive, 1.0 + 0.58 * f2 / (f2 + f_shelf**2), 1.0)  # ~+4dB boost
+    
+    k_weight = hp_gain * shelf_gain
+    
+    freqs.setflags(write=False)
+    k_weight.setflags(write=False)
+    return freqs, k_weight
 
 
 def band_balance_db(y: np.ndarray, sr: int) -> Dict[str, float]:
@@ -2965,45 +3235,35 @@ def band_balance_db(y: np.ndarray, sr: int) -> Dict[str, float]:
       Mid: 250–4000 Hz
       High: 4000–min(20000, Nyquist) Hz
     """
-    audio = y.mean(axis=0) if y.shape[0] > 1 else y[0]
-    audio = audio.astype(np.float64)
+    if y.shape[0] == 2:
+        # Same values as y.mean(axis=0) (L+R, halved in the input dtype) in one
+        # allocation instead of a reduction temporary plus a divided copy
+        audio = np.add(y[0], y[1])
+        audio *= 0.5
+    else:
+        audio = y.mean(axis=0) if y.shape[0] > 1 else y[0]
+    audio = audio.astype(np.float64, copy=False)
 
     # Parámetros STFT optimizados
     n_fft = 8192  # Mayor resolución para bajos
     hop = 2048
     
-    S = librosa.stft(audio, n_fft=n_fft, hop_length=hop, window="hann", center=True)
-    freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
-    
-    # Aplicar K-weighting (ITU-R BS.1770 simplificado)
-    #Highpass ~38 Hz + Highshelf ~1.5kHz
-    k_weight = np.ones_like(freqs)
-    
-    # Stage 1: Highpass filter (shelf at ~38 Hz)
-    f_hp = 38.0
-    for i, f in enumerate(freqs):
-        if f > 0:
-            # Simplified highpass response
-            k_weight[i] *= (f**2) / (f**2 + f_hp**2)
-    
-    # Stage 2: High-frequency shelf boost (~+4dB at 1.5kHz and above)
-    f_shelf = 1500.0
-    for i, f in enumerate(freqs):
-        if f > 0:
-            # Simplified high shelf
-            shelf_gain = 1.0 + 0.58 * (f**2) / (f**2 + f_shelf**2)  # ~+4dB boost
-            k_weight[i] *= shelf_gain
+    magnitude = _stft_magnitude(audio, n_fft, hop)
+    freqs, k_weight = _band_geometry(sr, n_fft)
     
     # Calcular magnitud con K-weighting aplicado
-    magnitude = np.abs(S) * k_weight[:, np.newaxis]
+    magnitude *= k_weight[:, np.newaxis]
     
     # Usar percentil 75 en vez de mean para mejor representación
     # Esto evita que bass sostenido domine sobre transientes
     # Usar múltiples percentiles para mayor robustez en tracks comprimidos
     # Percentil 60, 75, 90 capturan mejor la distribución real
-    P60 = np.percentile(magnitude**2, 60, axis=1)
-    P75 = np.percentile(magnitude**2, 75, axis=1)
-    P90 = np.percentile(magnitude**2, 90, axis=1)
+    # Potencia elevada al cuadrado una sola vez (in place) y los tres percentiles
+    # en una sola llamada: una partición por bin en vez de tres copias + tres
+    # particiones. La potencia no se usa después, así que puede reordenarse.
+    power = np.square(magnitude, out=magnitude)
+    P60, P75, P90 = np.percentile(power, [60, 75, 90], axis=1, overwrite_input=True)
+    del magnitude, power
     # Promedio ponderado: más peso a P75 (standard), menos a extremos
     P = (P60 * 0.2 + P75 * 0.6 + P90 * 0.2)
     
@@ -3011,11 +3271,12 @@ def band_balance_db(y: np.ndarray, sr: int) -> Dict[str, float]:
     hi_max = min(20000.0, nyq)
 
     def band_power(f_lo: float, f_hi: float) -> float:
-        idx = np.where((freqs >= f_lo) & (freqs < f_hi))[0]
-        if idx.size == 0:
+        # freqs está ordenado: los bins con f_lo <= f < f_hi son un tramo contiguo
+        lo, hi = np.searchsorted(freqs, (f_lo, f_hi))
+        if hi <= lo:
             return 1e-12
         # Integrar potencia ponderada con floor mínimo
-        power = float(np.sum(P[idx]))
+        power = float(P[lo:hi].sum())
         return max(power, 1e-12)  # Garantizar mínimo detectable
 
     low_p = band_power(20.0, 250.0)
@@ -3110,6 +3371,21 @@ def band_balance_db(y: np.ndarray, sr: int) -> Dict[str, float]:
     }
 
 
+def _windowed_rms(audio: np.ndarray, window_samples: int) -> np.ndarray:
+    """
+    RMS de cada ventana consecutiva de window_samples (se descarta la cola
+    incompleta; si el audio es más corto que una ventana, una sola ventana).
+    Acumula en float64 sin copiar la señal completa a float64.
+    """
+    n_windows = len(audio) // window_samples
+    if n_windows == 0:
+        frames = audio[np.newaxis, :]
+    else:
+        frames = audio[:n_windows * window_samples].reshape(n_windows, window_samples)
+    energy = np.einsum('ij,ij->i', frames, frames, dtype=np.float64)
+    return np.sqrt(energy / frames.shape[1])
+
+
 def calculate_energy_curve(y: np.ndarray, sr: int, window_ms: int = 500) -> Dict[str, Any]:
     """
     Calculate normalized energy curve for the entire track.
@@ -3117,21 +3393,12 @@ def calculate_energy_curve(y: np.ndarray, sr: int, window_ms: int = 500) -> Dict
     Also returns peak energy position as percentage of track length.
     """
     audio = y.mean(axis=0) if y.ndim > 1 and y.shape[0] > 1 else (y[0] if y.ndim > 1 else y)
-    audio = audio.astype(np.float64)
 
     window_samples = int(sr * window_ms / 1000)
     if window_samples < 1:
         window_samples = 1
 
-    num_windows = max(1, len(audio) // window_samples)
-    rms_values = []
-
-    for i in range(num_windows):
-        start = i * window_samples
-        end = min(start + window_samples, len(audio))
-        segment = audio[start:end]
-        rms = float(np.sqrt(np.mean(segment ** 2)))
-        rms_values.append(rms)
+    rms_values = _windowed_rms(audio, window_samples).tolist()
 
     if not rms_values:
         return {"energy_curve": [], "peak_energy_time_pct": 0.0, "energy_distribution": {"low": 0.0, "mid": 0.0, "high": 0.0}}
@@ -3241,6 +3508,28 @@ def round_band_percentages(low: float, mid: float, high: float) -> tuple:
 # ----------------------------
 # Reglas / estados
 # ----------------------------
+_HEADROOM_MSGS_EN = {
+    "critical": {
+        "normal": "Too little headroom, clipping risk. Use a Gain/Utility plugin AFTER your master bus chain (lower approximately {reduction_db} dB), then re-export. This preserves your mix balance and plugin sound.",
+        "master": "The file sits at the digital ceiling, so samples are being truncated. Lowering the limiter ceiling to around -0.3 dBFS and re-exporting recovers that without touching the loudness in any audible way.",
+    },
+    "warning": {
+        "strict": "Mix is running hot. Lower approximately {reduction_db} dB to leave comfortable headroom.",
+        "normal": "Mix is a bit hot. Lower approximately {reduction_db} dB to leave margin.",
+    },
+    "perfect": {
+        "strict": "Ideal headroom for commercial mastering delivery.",
+        "normal": "Headroom of {headroom_db:.1f} dB is what I'm looking for, gives me room to work with EQ, compression and limiting without compromising quality.",
+        "master": "The ceiling is respected, with {headroom_db:.1f} dB to spare. Nothing is being truncated on export.",
+    },
+    "pass": {
+        "strict": "Headroom is acceptable for mastering delivery.",
+        "normal": "Headroom is appropriate for mastering.",
+        "master": "The ceiling is respected, though the margin is slim. It holds.",
+    },
+    "conservative": "Very conservative level. Not wrong, but you could raise 1 to 3 dB if desired.",
+}
+
 def _status_headroom_en(peak_db: float, profile: str = PROFILE_MIX) -> Tuple[str, str, float]:
     """
     English headroom evaluation using UNIFIED scoring engine.
@@ -3251,29 +3540,29 @@ def _status_headroom_en(peak_db: float, profile: str = PROFILE_MIX) -> Tuple[str
     reduction_db = calculate_headroom_recommendation(peak_db, profile)
 
     # TRACK 2: Format message (Matías Voice - English)
-    messages = {
-        "critical": {
-            "normal": f"Too little headroom, clipping risk. Use a Gain/Utility plugin AFTER your master bus chain (lower approximately {reduction_db} dB), then re-export. This preserves your mix balance and plugin sound.",
-            "master": "The file sits at the digital ceiling, so samples are being truncated. Lowering the limiter ceiling to around -0.3 dBFS and re-exporting recovers that without touching the loudness in any audible way.",
-        },
-        "warning": {
-            "strict": f"Mix is running hot. Lower approximately {reduction_db} dB to leave comfortable headroom.",
-            "normal": f"Mix is a bit hot. Lower approximately {reduction_db} dB to leave margin.",
-        },
-        "perfect": {
-            "strict": "Ideal headroom for commercial mastering delivery.",
-            "normal": f"Headroom of {abs(peak_db):.1f} dB is what I'm looking for, gives me room to work with EQ, compression and limiting without compromising quality.",
-            "master": f"The ceiling is respected, with {abs(peak_db):.1f} dB to spare. Nothing is being truncated on export.",
-        },
-        "pass": {
-            "strict": "Headroom is acceptable for mastering delivery.",
-            "normal": "Headroom is appropriate for mastering.",
-            "master": "The ceiling is respected, though the margin is slim. It holds.",
-        },
-        "conservative": "Very conservative level. Not wrong, but you could raise 1 to 3 dB if desired.",
-    }
+    message = _pick_message(_HEADROOM_MSGS_EN, status, profile)
+    return status, message.format(reduction_db=reduction_db, headroom_db=abs(peak_db)), score
 
-    return status, _pick_message(messages, status, profile), score
+_TRUE_PEAK_MSGS_EN = {
+    "critical": {
+        "normal": "True peak is dangerously high. Lower the level and re-export to give mastering room to work.",
+        "master": "True peak reaches {tp_db:+.1f} dBTP, far past the ceiling. Encoders for Spotify, Apple Music and YouTube will distort this audibly. A true peak limiter set to -1.0 dBTP solves it.",
+    },
+    "warning": {
+        "strict": "True peak should be ≤ -3.0 dBTP for professional commercial delivery.",
+        "normal": "True peak is close to the limit. Aim for ≤ -1.0 dBTP to give mastering flexibility.",
+        "master": "True peak sits at {tp_db:+.1f} dBTP. Commercial masters live here routinely, but lossy encoding can add distortion above 0 dBTP. Worth a true peak limiter at -1.0 dBTP if the loudness allows it.",
+    },
+    "perfect": {
+        "normal": "True peak is safe for mastering. Provides enough margin for processing without quality compromises.",
+        "master": "True peak stays under the ceiling. Nothing will distort on encode.",
+    },
+    "pass": {
+        "strict": "True peak is acceptable, but -2 dBTP or better is ideal for clients/labels.",
+        "normal": "True peak is safe for mastering.",
+        "master": "True peak of {tp_db:+.1f} dBTP is where most commercial masters land. It can add distortion on lossy encode, which is a tradeoff most records accept.",
+    },
+}
 
 def _status_true_peak_en(tp_db: float, profile: str = PROFILE_MIX) -> Tuple[str, str, float, bool]:
     """
@@ -3285,28 +3574,8 @@ def _status_true_peak_en(tp_db: float, profile: str = PROFILE_MIX) -> Tuple[str,
     status, score, hard_fail = calculate_true_peak_score(tp_db, profile)
 
     # TRACK 2: Format message (Matías Voice - English)
-    messages = {
-        "critical": {
-            "normal": "True peak is dangerously high. Lower the level and re-export to give mastering room to work.",
-            "master": f"True peak reaches {tp_db:+.1f} dBTP, far past the ceiling. Encoders for Spotify, Apple Music and YouTube will distort this audibly. A true peak limiter set to -1.0 dBTP solves it.",
-        },
-        "warning": {
-            "strict": "True peak should be ≤ -3.0 dBTP for professional commercial delivery.",
-            "normal": "True peak is close to the limit. Aim for ≤ -1.0 dBTP to give mastering flexibility.",
-            "master": f"True peak sits at {tp_db:+.1f} dBTP. Commercial masters live here routinely, but lossy encoding can add distortion above 0 dBTP. Worth a true peak limiter at -1.0 dBTP if the loudness allows it.",
-        },
-        "perfect": {
-            "normal": "True peak is safe for mastering. Provides enough margin for processing without quality compromises.",
-            "master": "True peak stays under the ceiling. Nothing will distort on encode.",
-        },
-        "pass": {
-            "strict": "True peak is acceptable, but -2 dBTP or better is ideal for clients/labels.",
-            "normal": "True peak is safe for mastering.",
-            "master": f"True peak of {tp_db:+.1f} dBTP is where most commercial masters land. It can add distortion on lossy encode, which is a tradeoff most records accept.",
-        },
-    }
-
-    return status, _pick_message(messages, status, profile), score, hard_fail
+    message = _pick_message(_TRUE_PEAK_MSGS_EN, status, profile)
+    return status, message.format(tp_db=tp_db), score, hard_fail
 
 def _status_lufs_en(lufs: Optional[float], method: str, is_reliable: bool) -> Tuple[str, str, float]:
     """Evaluate LUFS with reliability consideration."""
@@ -3329,6 +3598,27 @@ def _status_lufs_en(lufs: Optional[float], method: str, is_reliable: bool) -> Tu
     # Everything between -10 and -40 LUFS is valid for mixes
     return "perfect", "Loudness is informational; final level is set during mastering.", 1.0
 
+_PLR_MSGS_EN = {
+    "perfect": {
+        "strict": "Optimal PLR: dynamics adequate for commercial delivery.",
+        "normal": "Dynamics are well preserved (PLR: {plr:.1f} dB). No over-limiting on the master bus, which leaves ample room to work the final loudness without sacrificing musicality.",
+        "master": "Dynamics survived the master (PLR: {plr:.1f} dB). The record still breathes at commercial level.",
+    },
+    "pass": {
+        "strict": "Good PLR for commercial, but ≥14 dB is ideal for maximum flexibility.",
+        "normal": "Adequate PLR for mastering.",
+        "master": "PLR of {plr:.1f} dB is healthy for a finished master.",
+    },
+    "warning": {
+        "normal": "The mix may already be quite limited (PLR: {plr:.1f} dB). Check master bus limiters/compressors. If you like their color, keep them but adjust so they don't reduce gain (raise threshold/ceiling). This preserves the character while recovering dynamics.",
+        "master": "PLR of {plr:.1f} dB means the limiter is working hard. The record will read as loud, and transients are paying for it. Backing the limiter off by a decibel or two is usually audible in the drums.",
+    },
+    "critical": {
+        "normal": "PLR very low ({plr:.1f} dB): over-compressed/limited. Remove limiters or adjust them to pass audio without gain reduction (for color only). Alternatively, use less compression on group buses.",
+        "master": "PLR of {plr:.1f} dB is a crushed master. There is very little difference left between the loudest and the average moment, so the track reads as flat and tiring no matter how loud it is. Streaming turns it down anyway, so the loudness bought nothing.",
+    },
+}
+
 def _status_plr_en(plr: Optional[float], has_real_lufs: bool, profile: str = PROFILE_MIX) -> Tuple[str, str, float]:
     """
     English PLR evaluation using UNIFIED scoring engine.
@@ -3341,28 +3631,8 @@ def _status_plr_en(plr: Optional[float], has_real_lufs: bool, profile: str = PRO
     status, score = calculate_plr_score(plr, has_real_lufs, profile)
 
     # TRACK 2: Format message (Matías Voice - English)
-    messages = {
-        "perfect": {
-            "strict": "Optimal PLR: dynamics adequate for commercial delivery.",
-            "normal": f"Dynamics are well preserved (PLR: {plr:.1f} dB). No over-limiting on the master bus, which leaves ample room to work the final loudness without sacrificing musicality.",
-            "master": f"Dynamics survived the master (PLR: {plr:.1f} dB). The record still breathes at commercial level.",
-        },
-        "pass": {
-            "strict": "Good PLR for commercial, but ≥14 dB is ideal for maximum flexibility.",
-            "normal": "Adequate PLR for mastering.",
-            "master": f"PLR of {plr:.1f} dB is healthy for a finished master.",
-        },
-        "warning": {
-            "normal": f"The mix may already be quite limited (PLR: {plr:.1f} dB). Check master bus limiters/compressors. If you like their color, keep them but adjust so they don't reduce gain (raise threshold/ceiling). This preserves the character while recovering dynamics.",
-            "master": f"PLR of {plr:.1f} dB means the limiter is working hard. The record will read as loud, and transients are paying for it. Backing the limiter off by a decibel or two is usually audible in the drums.",
-        },
-        "critical": {
-            "normal": f"PLR very low ({plr:.1f} dB): over-compressed/limited. Remove limiters or adjust them to pass audio without gain reduction (for color only). Alternatively, use less compression on group buses.",
-            "master": f"PLR of {plr:.1f} dB is a crushed master. There is very little difference left between the loudest and the average moment, so the track reads as flat and tiring no matter how loud it is. Streaming turns it down anyway, so the loudness bought nothing.",
-        },
-    }
-
-    return status, _pick_message(messages, status, profile), score
+    message = _pick_message(_PLR_MSGS_EN, status, profile)
+    return status, message.format(plr=plr), score
 
 def _status_stereo_en(corr: float, profile: str = PROFILE_MIX) -> Tuple[str, str, float]:
     """
@@ -3516,6 +3786,33 @@ def weights_for(profile: str) -> Dict[str, float]:
     return WEIGHTS_MASTER if profile == PROFILE_MASTER else WEIGHTS
 
 
+# Multiplicador de cada status sobre el peso de su métrica (score_report y
+# calculate_score_penalties). v7.4.0: agregado "poor" para correlación 0.1-0.3
+STATUS_MULTIPLIERS = {"perfect": 1.0, "pass": 0.9, "warning": 0.7, "poor": 0.4, "critical": 0.0, "catastrophic": 0.0, "info": 1.0, "conservative": 1.0}
+
+
+
+_HEADROOM_MSGS_ES = {
+    "critical": {
+        "normal": "Muy poco headroom (margen antes del máximo digital), con riesgo de clipping (saturación digital). Conviene añadir un plugin de ganancia al final del bus principal y reducir aproximadamente {reduction_db} dB antes de exportar nuevamente. Esto preserva el balance de la mezcla y el sonido de los plugins.",
+        "master": "El archivo llega al techo digital, así que se están truncando muestras. Bajar el techo del limitador a cerca de -0.3 dBFS y volver a exportar lo resuelve sin cambiar el volumen de forma audible.",
+    },
+    "warning": {
+        "strict": "Margen insuficiente para entrega comercial. Conviene reducir aproximadamente {reduction_db} dB para llegar a la zona ideal.",
+        "normal": "La mezcla está algo caliente. Conviene bajar aproximadamente {reduction_db} dB para dejar margen.",
+    },
+    "perfect": {
+        "strict": "Margen óptimo para entrega comercial profesional.",
+        "normal": "El margen de {headroom_db:.1f} dB deja espacio suficiente para trabajar EQ, compresión y limitación sin comprometer la calidad.",
+        "master": "El techo se respeta, con {headroom_db:.1f} dB de sobra. No se trunca nada al exportar.",
+    },
+    "pass": {
+        "strict": "Margen aceptable, pero -6 a -4 dBFS es ideal para clientes/sellos discográficos.",
+        "normal": "Margen adecuado para mastering.",
+        "master": "El techo se respeta, aunque el margen es mínimo. Alcanza.",
+    },
+    "conservative": "Nivel muy conservador. No es un problema, pero podrías subir 1 a 3 dB si lo deseas.",
+}
 
 def _status_headroom_es(peak_db: float, profile: str = PROFILE_MIX) -> Tuple[str, str, float]:
     """
@@ -3527,29 +3824,29 @@ def _status_headroom_es(peak_db: float, profile: str = PROFILE_MIX) -> Tuple[str
     reduction_db = calculate_headroom_recommendation(peak_db, profile)
 
     # TRACK 2: Formatear mensaje (Matías Voice - del eBook)
-    messages = {
-        "critical": {
-            "normal": f"Muy poco headroom (margen antes del máximo digital), con riesgo de clipping (saturación digital). Conviene añadir un plugin de ganancia al final del bus principal y reducir aproximadamente {reduction_db} dB antes de exportar nuevamente. Esto preserva el balance de la mezcla y el sonido de los plugins.",
-            "master": "El archivo llega al techo digital, así que se están truncando muestras. Bajar el techo del limitador a cerca de -0.3 dBFS y volver a exportar lo resuelve sin cambiar el volumen de forma audible.",
-        },
-        "warning": {
-            "strict": f"Margen insuficiente para entrega comercial. Conviene reducir aproximadamente {reduction_db} dB para llegar a la zona ideal.",
-            "normal": f"La mezcla está algo caliente. Conviene bajar aproximadamente {reduction_db} dB para dejar margen.",
-        },
-        "perfect": {
-            "strict": "Margen óptimo para entrega comercial profesional.",
-            "normal": f"El margen de {abs(peak_db):.1f} dB deja espacio suficiente para trabajar EQ, compresión y limitación sin comprometer la calidad.",
-            "master": f"El techo se respeta, con {abs(peak_db):.1f} dB de sobra. No se trunca nada al exportar.",
-        },
-        "pass": {
-            "strict": "Margen aceptable, pero -6 a -4 dBFS es ideal para clientes/sellos discográficos.",
-            "normal": "Margen adecuado para mastering.",
-            "master": "El techo se respeta, aunque el margen es mínimo. Alcanza.",
-        },
-        "conservative": "Nivel muy conservador. No es un problema, pero podrías subir 1 a 3 dB si lo deseas.",
-    }
+    message = _pick_message(_HEADROOM_MSGS_ES, status, profile)
+    return status, message.format(reduction_db=reduction_db, headroom_db=abs(peak_db)), score
 
-    return status, _pick_message(messages, status, profile), score
+_TRUE_PEAK_MSGS_ES = {
+    "critical": {
+        "normal": "True peak muy elevado. Conviene bajar el nivel y re-exportar para que el mastering pueda trabajar con margen.",
+        "master": "El true peak llega a {tp_db:+.1f} dBTP, muy por encima del techo. Los codificadores de Spotify, Apple Music y YouTube van a distorsionar esto de forma audible. Un limitador de true peak en -1.0 dBTP lo resuelve.",
+    },
+    "warning": {
+        "strict": "True peak conviene que sea ≤ -3.0 dBTP para entrega comercial profesional.",
+        "normal": "True peak muy cerca del límite. Apunta a ≤ -1.0 dBTP para dar flexibilidad al mastering.",
+        "master": "El true peak está en {tp_db:+.1f} dBTP. Los másters comerciales viven ahí de forma rutinaria, pero la codificación con pérdida puede agregar distorsión por encima de 0 dBTP. Conviene un limitador de true peak en -1.0 dBTP si el volumen lo permite.",
+    },
+    "perfect": {
+        "normal": "True peak seguro para mastering. Deja margen suficiente para procesar sin comprometer la calidad.",
+        "master": "El true peak se mantiene bajo el techo. Nada va a distorsionar al codificar.",
+    },
+    "pass": {
+        "strict": "True peak aceptable, pero -2 dBTP o menos es ideal para clientes/labels.",
+        "normal": "True peak seguro para mastering.",
+        "master": "Un true peak de {tp_db:+.1f} dBTP es donde aterriza la mayoría de los másters comerciales. Puede agregar distorsión al codificar con pérdida, un intercambio que casi todos los discos aceptan.",
+    },
+}
 
 def _status_true_peak_es(tp_db: float, profile: str = PROFILE_MIX) -> Tuple[str, str, float, bool]:
     """
@@ -3561,28 +3858,8 @@ def _status_true_peak_es(tp_db: float, profile: str = PROFILE_MIX) -> Tuple[str,
     status, score, hard_fail = calculate_true_peak_score(tp_db, profile)
 
     # TRACK 2: Formatear mensaje (Matías Voice - del eBook)
-    messages = {
-        "critical": {
-            "normal": "True peak muy elevado. Conviene bajar el nivel y re-exportar para que el mastering pueda trabajar con margen.",
-            "master": f"El true peak llega a {tp_db:+.1f} dBTP, muy por encima del techo. Los codificadores de Spotify, Apple Music y YouTube van a distorsionar esto de forma audible. Un limitador de true peak en -1.0 dBTP lo resuelve.",
-        },
-        "warning": {
-            "strict": "True peak conviene que sea ≤ -3.0 dBTP para entrega comercial profesional.",
-            "normal": "True peak muy cerca del límite. Apunta a ≤ -1.0 dBTP para dar flexibilidad al mastering.",
-            "master": f"El true peak está en {tp_db:+.1f} dBTP. Los másters comerciales viven ahí de forma rutinaria, pero la codificación con pérdida puede agregar distorsión por encima de 0 dBTP. Conviene un limitador de true peak en -1.0 dBTP si el volumen lo permite.",
-        },
-        "perfect": {
-            "normal": "True peak seguro para mastering. Deja margen suficiente para procesar sin comprometer la calidad.",
-            "master": "El true peak se mantiene bajo el techo. Nada va a distorsionar al codificar.",
-        },
-        "pass": {
-            "strict": "True peak aceptable, pero -2 dBTP o menos es ideal para clientes/labels.",
-            "normal": "True peak seguro para mastering.",
-            "master": f"Un true peak de {tp_db:+.1f} dBTP es donde aterriza la mayoría de los másters comerciales. Puede agregar distorsión al codificar con pérdida, un intercambio que casi todos los discos aceptan.",
-        },
-    }
-
-    return status, _pick_message(messages, status, profile), score, hard_fail
+    message = _pick_message(_TRUE_PEAK_MSGS_ES, status, profile)
+    return status, message.format(tp_db=tp_db), score, hard_fail
 
 def _status_lufs_es(lufs: Optional[float], method: str, is_reliable: bool) -> Tuple[str, str, float]:
     """Evalúa LUFS con consideración de confiabilidad."""
@@ -3605,6 +3882,27 @@ def _status_lufs_es(lufs: Optional[float], method: str, is_reliable: bool) -> Tu
     # Todo entre -10 y -40 LUFS es válido para mezclas
     return "perfect", "LUFS informativo. El volumen final se ajusta en mastering.", 1.0
 
+_PLR_MSGS_ES = {
+    "perfect": {
+        "strict": "PLR óptimo: dinámica adecuada para entrega comercial.",
+        "normal": "La dinámica está bien preservada (PLR: {plr:.1f} dB). No hay sobre-limitación en el bus principal, lo que deja amplio espacio para trabajar el volumen final sin sacrificar la musicalidad.",
+        "master": "La dinámica sobrevivió al mastering (PLR: {plr:.1f} dB). El disco todavía respira a nivel comercial.",
+    },
+    "pass": {
+        "strict": "PLR bueno para comercial, pero ≥14 dB es ideal para máxima flexibilidad.",
+        "normal": "PLR adecuado para mastering.",
+        "master": "Un PLR de {plr:.1f} dB es saludable para un máster terminado.",
+    },
+    "warning": {
+        "normal": "La mezcla ya puede estar bastante limitada (PLR: {plr:.1f} dB). Conviene revisar limitadores y compresores en el bus principal. Si su color es intencional, pueden conservarse ajustando el umbral y el techo para que no reduzcan ganancia. Así se preserva el carácter mientras se recupera dinámica.",
+        "master": "Un PLR de {plr:.1f} dB indica que el limitador está trabajando fuerte. El disco se va a leer fuerte y los transitorios lo están pagando. Soltar el limitador uno o dos decibeles suele notarse en la batería.",
+    },
+    "critical": {
+        "normal": "PLR muy bajo ({plr:.1f} dB): sobre-comprimida/limitada. Quita limitadores o ajústalos para que el audio solo PASE sin reducción de ganancia (solo para color). Alternativamente, usa menos compresión en buses de grupos.",
+        "master": "Un PLR de {plr:.1f} dB es un máster aplastado. Queda muy poca diferencia entre el momento más fuerte y el promedio, así que el track se lee plano y cansa, por fuerte que suene. Además el streaming lo baja de nivel igual, así que ese volumen no compró nada.",
+    },
+}
+
 def _status_plr_es(plr: Optional[float], has_real_lufs: bool, profile: str = PROFILE_MIX) -> Tuple[str, str, float]:
     """
     Evaluación de PLR en español usando scoring engine UNIFICADO.
@@ -3617,28 +3915,8 @@ def _status_plr_es(plr: Optional[float], has_real_lufs: bool, profile: str = PRO
     status, score = calculate_plr_score(plr, has_real_lufs, profile)
 
     # TRACK 2: Formatear mensaje (Matías Voice - del eBook)
-    messages = {
-        "perfect": {
-            "strict": "PLR óptimo: dinámica adecuada para entrega comercial.",
-            "normal": f"La dinámica está bien preservada (PLR: {plr:.1f} dB). No hay sobre-limitación en el bus principal, lo que deja amplio espacio para trabajar el volumen final sin sacrificar la musicalidad.",
-            "master": f"La dinámica sobrevivió al mastering (PLR: {plr:.1f} dB). El disco todavía respira a nivel comercial.",
-        },
-        "pass": {
-            "strict": "PLR bueno para comercial, pero ≥14 dB es ideal para máxima flexibilidad.",
-            "normal": "PLR adecuado para mastering.",
-            "master": f"Un PLR de {plr:.1f} dB es saludable para un máster terminado.",
-        },
-        "warning": {
-            "normal": f"La mezcla ya puede estar bastante limitada (PLR: {plr:.1f} dB). Conviene revisar limitadores y compresores en el bus principal. Si su color es intencional, pueden conservarse ajustando el umbral y el techo para que no reduzcan ganancia. Así se preserva el carácter mientras se recupera dinámica.",
-            "master": f"Un PLR de {plr:.1f} dB indica que el limitador está trabajando fuerte. El disco se va a leer fuerte y los transitorios lo están pagando. Soltar el limitador uno o dos decibeles suele notarse en la batería.",
-        },
-        "critical": {
-            "normal": f"PLR muy bajo ({plr:.1f} dB): sobre-comprimida/limitada. Quita limitadores o ajústalos para que el audio solo PASE sin reducción de ganancia (solo para color). Alternativamente, usa menos compresión en buses de grupos.",
-            "master": f"Un PLR de {plr:.1f} dB es un máster aplastado. Queda muy poca diferencia entre el momento más fuerte y el promedio, así que el track se lee plano y cansa, por fuerte que suene. Además el streaming lo baja de nivel igual, así que ese volumen no compró nada.",
-        },
-    }
-
-    return status, _pick_message(messages, status, profile), score
+    message = _pick_message(_PLR_MSGS_ES, status, profile)
+    return status, message.format(plr=plr), score
 
 def _status_stereo_es(corr: float, profile: str = PROFILE_MIX) -> Tuple[str, str, float]:
     """
@@ -3762,6 +4040,7 @@ def _status_dc_offset_es(dc_data: Dict[str, Any]) -> Tuple[str, str, float]:
 # Status evaluators (bilingual)
 # ----------------------------
 
+@lru_cache(maxsize=32)
 def _pick_lang(lang: str) -> str:
 
     lang = (lang or 'en').lower().strip()
@@ -3805,12 +4084,15 @@ def status_plr(plr: Optional[float], has_real_lufs: bool, strict: bool = False,
 
 
 
+_STATUS_STEREO = {"en": _status_stereo_en, "es": _status_stereo_es}
+
+
 def status_stereo(corr: float, lang: str = 'en', profile: Optional[str] = None) -> Tuple[str, str, float]:
 
     lang = _pick_lang(lang)
     profile = resolve_profile(profile=profile)
 
-    return _status_stereo_es(corr, profile) if lang == 'es' else _status_stereo_en(corr, profile)
+    return _STATUS_STEREO[lang](corr, profile)
 
 
 
@@ -3839,6 +4121,62 @@ def status_dc_offset(dc_data: Dict[str, Any], lang: str = 'en') -> Tuple[str, st
 
 
 
+# Bandas del veredicto: (puntaje mínimo, texto), de mayor a menor; la última
+# entrada (None) es el texto por debajo de todas las bandas.
+# Mezcla: filosofía de MARGEN, no de juicio
+_VERDICT_BANDS = {
+    ("master", "es"): (
+        (95, "✅ Máster listo para publicar"),
+        (85, "✅ Máster sólido"),
+        (75, "⚠️ Publicable, con detalles por revisar"),
+        (60, "⚠️ Máster con puntos que conviene revisar"),
+        (40, "⚠️ Máster con defectos claros"),
+        (20, "❌ Máster comprometido"),
+        (None, "❌ Requiere revisión antes de publicar"),
+    ),
+    ("master", "en"): (
+        (95, "✅ Master ready to release"),
+        (85, "✅ Solid master"),
+        (75, "⚠️ Releasable, with details to review"),
+        (60, "⚠️ Master has points worth reviewing"),
+        (40, "⚠️ Master has clear defects"),
+        (20, "❌ Compromised master"),
+        (None, "❌ Requires review before release"),
+    ),
+    ("mix", "es"): (
+        (95, "✅ Margen óptimo para mastering"),
+        (85, "✅ Lista para mastering"),
+        (75, "⚠️ Margen suficiente (revisar sugerencias)"),
+        (60, "⚠️ Margen reducido, conviene revisar antes de mastering"),
+        (40, "⚠️ Margen limitado, se recomiendan ajustes"),
+        (20, "❌ Margen comprometido para mastering"),
+        (5, "❌ Requiere revisión antes de mastering"),
+        (None, "❌ Sin margen para procesamiento adicional"),
+    ),
+    ("mix", "en"): (
+        (95, "✅ Optimal margin for mastering"),
+        (85, "✅ Ready for mastering"),
+        (75, "⚠️ Sufficient margin (review suggestions)"),
+        (60, "⚠️ Reduced margin, worth reviewing before mastering"),
+        (40, "⚠️ Limited margin, adjustments recommended"),
+        (20, "❌ Compromised margin for mastering"),
+        (5, "❌ Requires review before mastering"),
+        (None, "❌ No margin for additional processing"),
+    ),
+}
+
+
+def _verdict_from_bands(score: float, bands: Tuple[Tuple[Optional[int], str], ...]) -> str:
+    for threshold, verdict in bands:
+        if threshold is None or score >= threshold:
+            return verdict
+    return bands[-1][1]
+
+
+# Veredicto precalculado para cada puntaje entero 0-100 (el caso de score_report)
+_VERDICT_LUT = {key: tuple(_verdict_from_bands(score, bands) for score in range(101)) for key, bands in _VERDICT_BANDS.items()}
+
+
 def verdict_for_score(score: int, profile: str = PROFILE_MIX, lang: str = 'en') -> str:
     """
     Único origen del veredicto. La pantalla, el PDF y el frontend leen de aquí,
@@ -3848,70 +4186,10 @@ def verdict_for_score(score: int, profile: str = PROFILE_MIX, lang: str = 'en')
     Mezcla: ¿queda margen para masterizar?
     Máster: ¿está listo para publicar?
     """
-    lang = _pick_lang(lang)
-
-    if profile == PROFILE_MASTER:
-        if lang == 'es':
-            if score >= 95:
-                return "✅ Máster listo para publicar"
-            if score >= 85:
-                return "✅ Máster sólido"
-            if score >= 75:
-                return "⚠️ Publicable, con detalles por revisar"
-            if score >= 60:
-                return "⚠️ Máster con puntos que conviene revisar"
-            if score >= 40:
-                return "⚠️ Máster con defectos claros"
-            if score >= 20:
-                return "❌ Máster comprometido"
-            return "❌ Requiere revisión antes de publicar"
-        if score >= 95:
-            return "✅ Master ready to release"
-        if score >= 85:
-            return "✅ Solid master"
-        if score >= 75:
-            return "⚠️ Releasable, with details to review"
-        if score >= 60:
-            return "⚠️ Master has points worth reviewing"
-        if score >= 40:
-            return "⚠️ Master has clear defects"
-        if score >= 20:
-            return "❌ Compromised master"
-        return "❌ Requires review before release"
-
-    # Mezcla: filosofía de MARGEN, no de juicio
-    if lang == 'es':
-        if score >= 95:
-            return "✅ Margen óptimo para mastering"
-        if score >= 85:
-            return "✅ Lista para mastering"
-        if score >= 75:
-            return "⚠️ Margen suficiente (revisar sugerencias)"
-        if score >= 60:
-            return "⚠️ Margen reducido, conviene revisar antes de mastering"
-        if score >= 40:
-            return "⚠️ Margen limitado, se recomiendan ajustes"
-        if score >= 20:
-            return "❌ Margen comprometido para mastering"
-        if score >= 5:
-            return "❌ Requiere revisión antes de mastering"
-        return "❌ Sin margen para procesamiento adicional"
-
-    if score >= 95:
-        return "✅ Optimal margin for mastering"
-    if score >= 85:
-        return "✅ Ready for mastering"
-    if score >= 75:
-        return "⚠️ Sufficient margin (review suggestions)"
-    if score >= 60:
-        return "⚠️ Reduced margin, worth reviewing before mastering"
-    if score >= 40:
-        return "⚠️ Limited margin, adjustments recommended"
-    if score >= 20:
-        return "❌ Compromised margin for mastering"
-    if score >= 5:
-        return "❌ Requires review before mastering"
-    return "❌ No margin for additional processing"
+    key = ("master" if profile == PROFILE_MASTER else "mix", _pick_lang(lang))
+    if type(score) is int and 0 <= score <= 100:
+        return _VERDICT_LUT[key][score]
+    return _verdict_from_bands(score, _VERDICT_BANDS[key])
 
 
 def verdict_text_only(score: int, profile: str = PROFILE_MIX, lang: str = 'en') -> str:
@@ -3937,12 +4215,18 @@ def score_report(
     if hard_fail:
         return 5, verdict_for_score(5, profile, lang)
 
-    # v7.4.0: Added "poor" status for correlation 0.1-0.3
-    mult = {"perfect": 1.0, "pass": 0.9, "warning": 0.7, "poor": 0.4, "critical": 0.0, "catastrophic": 0.0, "info": 1.0, "conservative": 1.0}
+    mult = STATUS_MULTIPLIERS
     weights = weights_for(profile)
     total = 0.0
     wsum = 0.0
 
+    # Crest Factor solo cuenta si no hay PLR real
+    has_plr = any(
+        m.get("internal_key", m["name"]) == "PLR"
+        and m.get("value") != "N/A"
+        for m in metrics
+    )
+
     for m in metrics:
         # Use internal_key for weight lookup (always English)
         internal_key = m.get("internal_key", m["name"])
@@ -3950,17 +4234,10 @@ def score_report(
         if w <= 0:
             continue
 
-        # Crest Factor solo cuenta si no hay PLR real
         if internal_key == "Crest Factor":
-            has_plr = any(
-                metric.get("internal_key", metric["name"]) == "PLR"
-                and metric.get("value") != "N/A"
-                for metric in metrics
-            )
             if has_plr:
                 continue  # Skip crest factor si tenemos PLR
-            else:
-                w = weights["PLR"]  # Usar peso de PLR si no hay PLR
+            w = weights["PLR"]  # Usar peso de PLR si no hay PLR
 
         wsum += w
         total += w * mult.get(m["status"], 0.0)
@@ -4037,7 +4314,7 @@ def calculate_score_penalties(
     """
     lang = _pick_lang(lang)
     profile = resolve_profile(profile=profile)
-    mult = {"perfect": 1.0, "pass": 0.9, "warning": 0.7, "poor": 0.4, "critical": 0.0, "catastrophic": 0.0, "info": 1.0, "conservative": 1.0}
+    mult = STATUS_MULTIPLIERS
     weights = weights_for(profile)
 
     # PLF label mapping: internal_key -> (ES observation, EN observation)
@@ -4142,6 +4419,8 @@ def calculate_score_penalties(
 def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, strict: bool = False, lang: str = "en", original_metadata: Optional[Dict] = None, profile: Optional[str] = None) -> Dict[str, Any]:
     """Analyze a full audio file."""
     start_time = time.time()  # Start timing
+    lang_picked = _pick_lang(lang)
+    names = METRIC_NAMES[lang_picked]
     try:
         info = sf.info(str(path))
     except Exception as e:
@@ -4179,16 +4458,18 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     if duration < 0.5:
         raise RuntimeError(f"Archivo demasiado corto ({duration:.2f}s). Mínimo 0.5s.")
     
+    # soundfile directo: mismo buffer float32 que librosa.load a tasa nativa,
+    # sin pasar por su envoltorio (always_2d ya da forma (canales, muestras))
     try:
-        y, sr_loaded = librosa.load(str(path), sr=sr, mono=False)
+        y, sr_loaded = sf.read(str(path), dtype="float32", always_2d=True)
     except Exception as e:
-        raise RuntimeError(f"Error cargando audio con librosa: {e}")
+        raise RuntimeError(f"Error cargando audio: {e}")
+    y = y.T
     
     if sr_loaded != sr:
-        sr = int(sr_loaded)
-    
-    if y.ndim == 1:
-        y = y[np.newaxis, :]
+        # original_metadata trae la tasa del archivo original: se re-muestrea
+        # a ella igual que lo hacía librosa.load(sr=sr)
+        y = librosa.resample(y, orig_sr=sr_loaded, target_sr=sr, res_type="soxr_hq")
 
     # v7.4.1 FIX: Detect mono/pseudo-stereo (parity with chunked mode)
     # Check a middle segment — skip first/last 5s per temporal analysis rules
@@ -4216,12 +4497,18 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     # and the profile depends on peak, true peak, LUFS and PLR. So all four are
     # measured up front. They are pure functions of the audio, so hoisting them
     # changes nothing except the order in which they are known.
-    peak = peak_dbfs(y)
+    #
+    # Every whole-track statistic below (peak, crest factor, DC offset, M/S,
+    # L/R balance, correlation) is arithmetic on one pass of sums.
+    moments = signal_moments(y)
+    peak = peak_dbfs(y, moments)
     headroom = -peak
-    sample_peak = float(np.max(np.abs(y))) if y.size else 0.0
+    sample_peak = float(moments["peak"].max()) if y.size else 0.0
     clipping = sample_peak >= 0.999999
-    tp = oversampled_true_peak_db(y, os_factor=oversample)
-    lufs, lufs_method, lufs_reliable = integrated_lufs(y, sr, duration)
+    # The oversampled envelope is kept for the temporal true-peak scan below
+    tp_envelope = _oversampled_abs_envelope(y, max(1, oversample))
+    tp = oversampled_true_peak_db(y, os_factor=oversample, envelope=tp_envelope)
+    lufs, lufs_method, lufs_reliable = integrated_lufs(y, sr, duration, moments)
     has_real_lufs = HAS_PYLOUDNORM and lufs_method.startswith("pyloudnorm")
     plr = tp - lufs if (has_real_lufs and lufs is not None and tp is not None) else None
 
@@ -4243,7 +4530,7 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     st, msg, _ = status_headroom(peak, lang=lang, profile=active_profile)
 
     headroom_metric = {
-        "name": METRIC_NAMES[_pick_lang(lang)]["Headroom"],
+        "name": names["Headroom"],
         "internal_key": "Headroom",
         "value": f"{headroom:.1f} dB",
         "peak_db": f"{peak:.1f} dBFS",
@@ -4270,12 +4557,11 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
         # Strict mode uses more conservative threshold (-2.0 dBTP vs -1.0 dBTP)
         # -2.0 aligns with professional high-end standards (~-6 dBFS headroom from eBook)
         tp_threshold = -2.0 if strict else -1.0
-        tp_temporal = analyze_true_peak_temporal(y, sr, oversample, threshold=tp_threshold)
+        tp_temporal = analyze_true_peak_temporal(y, sr, oversample, threshold=tp_threshold, envelope=tp_envelope)
         
         # If no regions found but TP is high, create informative message
         # This happens when peak is brief (transient) but still problematic
         if tp_temporal and tp_temporal.get('total_regions', 0) == 0:
-            lang_picked = _pick_lang(lang)
             if lang_picked == 'es':
                 info_message = (
                     f"El pico máximo ({tp:.1f} dBTP) está cerca del límite digital, "
@@ -4294,9 +4580,10 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
             # Add info fields to the temporal data
             tp_temporal['info_only'] = True
             tp_temporal['info_message'] = info_message
+    del tp_envelope
     
     tp_metric = {
-        "name": METRIC_NAMES[_pick_lang(lang)]["True Peak"],
+        "name": names["True Peak"],
         "internal_key": "True Peak",
         "value": f"{tp:.1f} dBTP",
         "raw_true_peak_db": float(tp),
@@ -4314,7 +4601,7 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     st_l, msg_l, _ = status_lufs(lufs, lufs_method, lufs_reliable, lang)
 
     metrics.append({
-        "name": METRIC_NAMES[_pick_lang(lang)]["LUFS (Integrated)"],
+        "name": names["LUFS (Integrated)"],
         "internal_key": "LUFS (Integrated)",  # For WEIGHTS lookup
         "value": f"{lufs:.2f} {lufs_label}" if lufs is not None else "N/A",
         "status": st_l,
@@ -4326,7 +4613,7 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     # 4. PLR (measured in step 0)
     st_p, msg_p, _ = status_plr(plr, has_real_lufs, lang=lang, profile=active_profile)
     metrics.append({
-        "name": METRIC_NAMES[_pick_lang(lang)]["PLR"],
+        "name": names["PLR"],
         "internal_key": "PLR",  # For WEIGHTS lookup
         "value": f"{plr:.1f} dB" if plr is not None else "N/A",
         # Unrounded, for the bars: a PLR of 5.95 prints as "6.0" and would land in
@@ -4337,10 +4624,9 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     })
 
     # 5. Crest Factor (alternativa a PLR cuando no hay LUFS real)
-    crest = calculate_crest_factor(y)
+    crest = calculate_crest_factor(y, moments)
     st_cf, msg_cf, _ = status_crest_factor(crest, lang)
     
-    lang_picked = _pick_lang(lang)
     if has_real_lufs:
         # When PLR is available, Crest Factor is informational only
         cf_status = "info"
@@ -4351,7 +4637,7 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
         cf_message = msg_cf
     
     metrics.append({
-        "name": METRIC_NAMES[lang_picked]["Crest Factor"],
+        "name": names["Crest Factor"],
         "internal_key": "Crest Factor",  # For WEIGHTS lookup
         "value": f"{crest:.1f} dB",
         "status": cf_status,
@@ -4359,14 +4645,13 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     })
 
     # 6. DC Offset
-    dc_data = detect_dc_offset(y)
+    dc_data = detect_dc_offset(y, moments)
     st_dc, msg_dc, _ = status_dc_offset(dc_data, lang)
 
-    lang_picked = _pick_lang(lang)
     dc_value = f"{dc_data['max_offset']:.4f}" if dc_data["detected"] else ("No detectado" if lang_picked == 'es' else "Not detected")
 
     metrics.append({
-        "name": METRIC_NAMES[lang_picked]["DC Offset"],
+        "name": names["DC Offset"],
         "internal_key": "DC Offset",  # For WEIGHTS lookup
         "value": dc_value,
         "status": st_dc,
@@ -4375,9 +4660,9 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     })
 
     # 7. Stereo Field Analysis (Correlation + M/S + L/R Balance) with Temporal Analysis
-    corr = stereo_correlation(y)
-    ms_ratio, mid_rms, side_rms = calculate_ms_ratio(y, debug=True)  # Enable debug for investigation
-    lr_balance_db = calculate_lr_balance(y)
+    corr = stereo_correlation(y, moments)
+    ms_ratio, mid_rms, side_rms = calculate_ms_ratio(y, moments=moments)
+    lr_balance_db = calculate_lr_balance(y, moments)
     
     # Temporal analysis for each parameter if problematic
     corr_temporal = None
@@ -4390,21 +4675,31 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     ms_high_threshold = 1.5 if strict else 1.8  # FIX: Was 1.2/1.5, now 1.5/1.8 (more permissive)
     lr_threshold = 2.0 if strict else 3.0
     
-    if corr < 0.5:  # Analyze if correlation is problematic
-        corr_temporal = analyze_correlation_temporal(y, sr, threshold=corr_threshold)
+    corr_problem = corr < 0.5
+    ms_problem = ms_ratio < ms_low_threshold or ms_ratio > ms_high_threshold
+    lr_problem = abs(lr_balance_db) > lr_threshold
+    
+    # The three temporal analyses read the same per-window sums (one pass)
+    window_stats = None
+    if y.shape[0] >= 2 and (corr_problem or ms_problem or lr_problem):
+        window_stats = _temporal_window_moments(y, sr)
+    
+    if corr_problem:  # Analyze if correlation is problematic
+        corr_temporal = analyze_correlation_temporal(y, sr, threshold=corr_threshold, moments=window_stats)
     
-    if ms_ratio < ms_low_threshold or ms_ratio > ms_high_threshold:  # Analyze if M/S is problematic
-        ms_temporal = analyze_ms_ratio_temporal(y, sr, low_threshold=ms_low_threshold, high_threshold=ms_high_threshold)
+    if ms_problem:  # Analyze if M/S is problematic
+        ms_temporal = analyze_ms_ratio_temporal(y, sr, low_threshold=ms_low_threshold, high_threshold=ms_high_threshold, moments=window_stats)
     
-    if abs(lr_balance_db) > lr_threshold:  # Analyze if L/R balance is problematic
-        lr_temporal = analyze_lr_balance_temporal(y, sr, threshold=lr_threshold)
+    if lr_problem:  # Analyze if L/R balance is problematic
+        lr_temporal = analyze_lr_balance_temporal(y, sr, threshold=lr_threshold, moments=window_stats)
+    del window_stats
     
     # Comprehensive evaluation with M/S and L/R context
     st_s, msg_s = evaluate_stereo_field_comprehensive(corr, ms_ratio, lr_balance_db, lang, strict)
     
     # Enhanced stereo metric with M/S and L/R info
     stereo_metric = {
-        "name": METRIC_NAMES[_pick_lang(lang)]["Stereo Width"],
+        "name": names["Stereo Width"],
         "internal_key": "Stereo Width",
         "value": f"{corr*100:.0f}% corr | M/S: {ms_ratio:.2f} | L/R: {_fmt_lr(lr_balance_db)} dB",
         "correlation": corr,
@@ -4477,7 +4772,7 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
         mono_msg_es = "Archivo mono detectado. El análisis estéreo no aplica."
         mono_msg_en = "Mono file detected. Stereo analysis does not apply."
         stereo_metric = {
-            "name": METRIC_NAMES[_pick_lang(lang)]["Stereo Width"],
+            "name": names["Stereo Width"],
             "internal_key": "Stereo Width",
             "value": "Mono",
             "correlation": 1.0,
@@ -4501,7 +4796,6 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     tonal_health = calculate_tonal_balance_percentage(fb['low_percent'], fb['mid_percent'], fb['high_percent'])
     
     # Localize frequency band labels for Spanish users
-    lang_picked = _pick_lang(lang)
     if lang_picked == 'es':
         low_label, mid_label, high_label = "Graves", "Medios", "Agudos"
         delta_low_mid = "ΔG-M"
@@ -4515,7 +4809,7 @@ def analyze_file(path: Path, oversample: int = 4, genre: Optional[str] = None, s
     low_r, mid_r, high_r = round_band_percentages(fb['low_percent'], fb['mid_percent'], fb['high_percent'])
 
     metrics.append({
-        "name": METRIC_NAMES[lang_picked]["Frequency Balance"],
+        "name": names["Frequency Balance"],
         "internal_key": "Frequency Balance",  # For WEIGHTS lookup
         "value": (
             f"{low_label}: {low_r}% | "
@@ -4873,6 +5167,129 @@ def _report_true_peak(report: Dict[str, Any]) -> Optional[float]:
     return None
 
 
+# CTA de mezcla por idioma: (puntaje mínimo, CTA), de mayor a menor; None cierra la escala
+_CTA_MIX = {
+    "es": (
+        # Spanish CTAs - ES LATAM Neutro
+        (95, {
+            "message": (
+                "🎧 Tu mezcla está lista.\n"
+                "Está técnicamente preparada para el mastering. Si quieres, escríbenos y coordinamos el proceso."
+            ),
+            "button": "Masterizar este track",
+            "action": "mastering",
+        }),
+        (85, {
+            "message": (
+                "🎧 Tu mezcla está en muy buen estado.\n"
+                "Hay detalles menores que podrían optimizarse, pero no comprometen el resultado. Si quieres avanzar, escríbenos y lo coordinamos."
+            ),
+            "button": "Masterizar este track",
+            "action": "mastering",
+        }),
+        (75, {
+            "message": (
+                "🔧 Tu mezcla está cerca.\n"
+                "Hay aspectos técnicos que conviene revisar antes del mastering. Corregirlos ahora mejora significativamente el resultado final. Si necesitas orientación, escríbenos."
+            ),
+            "button": "Preparar mi mezcla",
+            "action": "preparation",
+        }),
+        (60, {
+            "message": (
+                "🔧 Tu mezcla necesita ajustes antes del mastering.\n"
+                "Hay decisiones técnicas en tu mezcla que pueden afectar el resultado del mastering. No significa que esté mal. Significa que hay ajustes que conviene hacer antes. Si quieres que te ayudemos a identificarlos, escríbenos."
+            ),
+            "button": "Revisar mi mezcla",
+            "action": "preparation",
+        }),
+        (40, {
+            "message": (
+                "🔧 Tu mezcla necesita trabajo en áreas clave.\n"
+                "Enviarlo en este estado limita el margen de maniobra del mastering. Hay aspectos técnicos que resolver antes para que el proceso funcione bien. Si quieres, escríbenos y revisamos juntos los puntos críticos."
+            ),
+            "button": "Trabajar mi mezcla",
+            "action": "review",
+        }),
+        (20, {
+            "message": (
+                "🔍 Tu mezcla tiene problemas técnicos importantes.\n"
+                "No recomiendo masterizar en este estado. El resultado difícilmente será competitivo. Si quieres, escríbenos y trabajamos juntos los puntos a resolver."
+            ),
+            "button": "Trabajar mi mezcla",
+            "action": "review",
+        }),
+        (None, {
+            "message": (
+                "🔍 Tu mezcla necesita una revisión profunda.\n"
+                "Hay decisiones fundamentales de balance, dinámica o estructura que resolver antes de pensar en mastering. Si quieres, escríbenos y te ayudamos a armar un plan de trabajo."
+            ),
+            "button": "Revisar mi proyecto",
+            "action": "review",
+        }),
+    ),
+    "en": (
+        # English CTAs - US English
+        (95, {
+            "message": (
+                "🎧 Your mix is ready.\n"
+                "It's technically prepared for mastering. If you'd like, write us and we'll coordinate the process."
+            ),
+            "button": "Master this track",
+            "action": "mastering",
+        }),
+        (85, {
+            "message": (
+                "🎧 Your mix is in great shape.\n"
+                "There are minor details that could be optimized, but they won't compromise the result. If you'd like to move forward, write us and we'll coordinate."
+            ),
+            "button": "Master this track",
+            "action": "mastering",
+        }),
+        (75, {
+            "message": (
+                "🔧 Your mix is close.\n"
+                "There are technical aspects worth reviewing before mastering. Fixing them now significantly improves the final result. If you need guidance, write us."
+            ),
+            "button": "Prepare my mix",
+            "action": "preparation",
+        }),
+        (60, {
+            "message": (
+                "🔧 Your mix needs adjustments before mastering.\n"
+                "There are technical decisions in your mix that could affect the mastering result. It doesn't mean it's wrong. It means there are adjustments worth making first. If you'd like help identifying them, write us."
+            ),
+            "button": "Review my mix",
+            "action": "preparation",
+        }),
+        (40, {
+            "message": (
+                "🔧 Your mix needs work in key areas.\n"
+                "In this state, mastering has limited room to work. There are technical aspects to resolve first so the process works as it should. If you'd like, write us and we'll review the critical points together."
+            ),
+            "button": "Work on my mix",
+            "action": "review",
+        }),
+        (20, {
+            "message": (
+                "🔍 Your mix has significant technical issues.\n"
+                "I don't recommend mastering in this state. The result is unlikely to be competitive. If you'd like, write us and we'll work through the issues together."
+            ),
+            "button": "Work on my mix",
+            "action": "review",
+        }),
+        (None, {
+            "message": (
+                "🔍 Your mix needs a deep review.\n"
+                "There are fundamental decisions around balance, dynamics, or structure to resolve before considering mastering. If you'd like, write us and we'll help you build a work plan."
+            ),
+            "button": "Review my project",
+            "action": "review",
+        }),
+    ),
+}
+
+
 def generate_cta(score: int, strict: bool, lang: str, mode: str = "write", profile: Optional[str] = None,
                  true_peak: Optional[float] = None, profile_source: str = "user") -> Dict[str, str]:
     """
@@ -4897,149 +5314,77 @@ def generate_cta(score: int, strict: bool, lang: str, mode: str = "write", profi
     if resolve_profile(strict, profile) == PROFILE_MASTER:
         return _generate_cta_master(score, _pick_lang(lang), true_peak=true_peak, profile_source=profile_source)
 
-    if lang == 'es':
-        # Spanish CTAs - ES LATAM Neutro
-        if score >= 95:
-            return {
-                "message": (
-                    "🎧 Tu mezcla está lista.\n"
-                    "Está técnicamente preparada para el mastering. Si quieres, escríbenos y coordinamos el proceso."
-                ),
-                "button": "Masterizar este track",
-                "action": "mastering"
-            }
-
-        elif score >= 85:
-            return {
-                "message": (
-                    "🎧 Tu mezcla está en muy buen estado.\n"
-                    "Hay detalles menores que podrían optimizarse, pero no comprometen el resultado. Si quieres avanzar, escríbenos y lo coordinamos."
-                ),
-                "button": "Masterizar este track",
-                "action": "mastering"
-            }
-
-        elif score >= 75:
-            return {
-                "message": (
-                    "🔧 Tu mezcla está cerca.\n"
-                    "Hay aspectos técnicos que conviene revisar antes del mastering. Corregirlos ahora mejora significativamente el resultado final. Si necesitas orientación, escríbenos."
-                ),
-                "button": "Preparar mi mezcla",
-                "action": "preparation"
-            }
-
-        elif score >= 60:
-            return {
-                "message": (
-                    "🔧 Tu mezcla necesita ajustes antes del mastering.\n"
-                    "Hay decisiones técnicas en tu mezcla que pueden afectar el resultado del mastering. No significa que esté mal. Significa que hay ajustes que conviene hacer antes. Si quieres que te ayudemos a identificarlos, escríbenos."
-                ),
-                "button": "Revisar mi mezcla",
-                "action": "preparation"
-            }
-
-        elif score >= 40:
-            return {
-                "message": (
-                    "🔧 Tu mezcla necesita trabajo en áreas clave.\n"
-                    "Enviarlo en este estado limita el margen de maniobra del mastering. Hay aspectos técnicos que resolver antes para que el proceso funcione bien. Si quieres, escríbenos y revisamos juntos los puntos críticos."
-                ),
-                "button": "Trabajar mi mezcla",
-                "action": "review"
-            }
+    for threshold, cta in _CTA_MIX["es" if lang == 'es' else "en"]:
+        if threshold is None or score >= threshold:
+            return dict(cta)
 
-        elif score >= 20:
-            return {
-                "message": (
-                    "🔍 Tu mezcla tiene problemas técnicos importantes.\n"
-                    "No recomiendo masterizar en este estado. El resultado difícilmente será competitivo. Si quieres, escríbenos y trabajamos juntos los puntos a resolver."
-                ),
-                "button": "Trabajar mi mezcla",
-                "action": "review"
-            }
 
-        else:
-            return {
-                "message": (
-                    "🔍 Tu mezcla necesita una revisión profunda.\n"
-                    "Hay decisiones fundamentales de balance, dinámica o estructura que resolver antes de pensar en mastering. Si quieres, escríbenos y te ayudamos a armar un plan de trabajo."
-                ),
-                "button": "Revisar mi proyecto",
-                "action": "review"
-            }
+def _metrics_by_key(metrics: List[Dict]) -> Dict[str, Dict]:
+    """Índice internal_key -> métrica (la primera si hay repetidas)."""
+    by_key: Dict[str, Dict] = {}
+    for m in metrics:
+        by_key.setdefault(m.get("internal_key", ""), m)
+    return by_key
 
-    else:
-        # English CTAs - US English
-        if score >= 95:
-            return {
-                "message": (
-                    "🎧 Your mix is ready.\n"
-                    "It's technically prepared for mastering. If you'd like, write us and we'll coordinate the process."
-                ),
-                "button": "Master this track",
-                "action": "mastering"
-            }
 
-        elif score >= 85:
-            return {
-                "message": (
-                    "🎧 Your mix is in great shape.\n"
-                    "There are minor details that could be optimized, but they won't compromise the result. If you'd like to move forward, write us and we'll coordinate."
-                ),
-                "button": "Master this track",
-                "action": "mastering"
-            }
+def _display_number(text: str) -> Optional[float]:
+    """Número inicial de un valor de display ("11.8 dB" -> 11.8), o None si no lo hay."""
+    try:
+        return float(text.split()[0])
+    except (ValueError, IndexError):
+        return None
 
-        elif score >= 75:
-            return {
-                "message": (
-                    "🔧 Your mix is close.\n"
-                    "There are technical aspects worth reviewing before mastering. Fixing them now significantly improves the final result. If you need guidance, write us."
-                ),
-                "button": "Prepare my mix",
-                "action": "preparation"
-            }
 
-        elif score >= 60:
-            return {
-                "message": (
-                    "🔧 Your mix needs adjustments before mastering.\n"
-                    "There are technical decisions in your mix that could affect the mastering result. It doesn't mean it's wrong. It means there are adjustments worth making first. If you'd like help identifying them, write us."
-                ),
-                "button": "Review my mix",
-                "action": "preparation"
-            }
+def _optional_line_templates(lines: Tuple[str, ...], head: str = "", tail: str = "\n") -> Tuple[str, ...]:
+    """
+    Una plantilla por combinación de líneas opcionales presentes, indexada por
+    máscara de bits (lines[0] es el bit más alto): head + líneas presentes + tail.
+    """
+    n = len(lines)
+    return tuple(
+        head + "".join(line for i, line in enumerate(lines) if mask >> (n - 1 - i) & 1) + tail
+        for mask in range(1 << n)
+    )
 
-        elif score >= 40:
-            return {
-                "message": (
-                    "🔧 Your mix needs work in key areas.\n"
-                    "In this state, mastering has limited room to work. There are technical aspects to resolve first so the process works as it should. If you'd like, write us and we'll review the critical points together."
-                ),
-                "button": "Work on my mix",
-                "action": "review"
-            }
 
-        elif score >= 20:
-            return {
-                "message": (
-                    "🔍 Your mix has significant technical issues.\n"
-                    "I don't recommend mastering in this state. The result is unlikely to be competitive. If you'd like, write us and we'll work through the issues together."
-                ),
-                "button": "Work on my mix",
-                "action": "review"
-            }
+# Texto fijo de build_technical_details, por idioma
+_TECH_DETAILS_BANNER = {
+    "es": "\n\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n📊 DETALLES TÉCNICOS COMPLETOS\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n",
+    "en": "\n\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n📊 COMPLETE TECHNICAL DETAILS\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n",
+}
+_STEREO_DETAIL_FOOTER = {
+    "es": "   → Imagen estéreo con buena compatibilidad mono.\n     Se traducirá bien en diferentes sistemas.\n\n",
+    "en": "   → Stereo image with good mono compatibility.\n     Will translate well across systems.\n\n",
+}
+_FREQ_DETAIL_FOOTER = {
+    "es": "   → Distribución tonal balanceada.\n",
+    "en": "   → Balanced tonal distribution.\n",
+}
 
-        else:
-            return {
-                "message": (
-                    "🔍 Your mix needs a deep review.\n"
-                    "There are fundamental decisions around balance, dynamics, or structure to resolve before considering mastering. If you'd like, write us and we'll help you build a work plan."
-                ),
-                "button": "Review my project",
-                "action": "review"
-            }
+# Bloques de valores de build_technical_details, con el encabezado de la
+# sección. Estéreo: máscara (M/S, L/R); frecuencias: máscara (graves, medios, agudos).
+_STEREO_DETAIL_TEMPLATES = {
+    "es": _optional_line_templates(
+        ("   • Relación M/S: {ms_ratio:.2f}\n", "   • Balance L/R: {lr} dB\n"),
+        head="🎧 IMAGEN ESTÉREO:\n   • Correlación: {corr:.2f}\n",
+    ),
+    "en": _optional_line_templates(
+        ("   • M/S Ratio: {ms_ratio:.2f}\n", "   • L/R Balance: {lr} dB\n"),
+        head="🎧 STEREO FIELD:\n   • Correlation: {corr}\n",
+    ),
+}
+_FREQ_DETAIL_TEMPLATES = {
+    "es": _optional_line_templates((
+        "   • Graves (20-250 Hz): {bass}%\n",
+        "   • Medios (250 Hz-4 kHz): {mid}%\n",
+        "   • Agudos (4 kHz-20 kHz): {high}%\n",
+    ), head="🎼 BALANCE DE FRECUENCIAS:\n"),
+    "en": _optional_line_templates((
+        "   • Lows (20-250 Hz): {bass}%\n",
+        "   • Mids (250 Hz-4 kHz): {mid}%\n",
+        "   • Highs (4 kHz-20 kHz): {high}%\n",
+    ), head="🎼 FREQUENCY BALANCE:\n"),
+}
 
 
 def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
@@ -5049,24 +5394,23 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
     Includes explanation of EVERY metric with context.
     """
     lang = _pick_lang(lang)
+    by_key = _metrics_by_key(metrics)
     
     if lang == 'es':
-        details = "\n\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        details += "📊 DETALLES TÉCNICOS COMPLETOS\n"
-        details += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+        parts = [_TECH_DETAILS_BANNER["es"]]
         
         # HEADROOM
-        headroom_metric = next((m for m in metrics if "Headroom" in m.get("internal_key", "")), None)
+        headroom_metric = by_key.get("Headroom")
         if headroom_metric:
             peak_val = headroom_metric.get("peak_db", "")
-            details += f"🎚️ HEADROOM: {peak_val}\n"
+            parts.append(f"🎚️ HEADROOM: {peak_val}\n")
             hr_status = headroom_metric.get("status", "pass")
             if hr_status in ("perfect", "pass"):
-                details += "   → Los picos dejan suficiente espacio para procesamiento\n"
-                details += "     sin riesgo de clipping (saturación digital) durante el mastering.\n"
+                parts.append("   → Los picos dejan suficiente espacio para procesamiento\n")
+                parts.append("     sin riesgo de clipping (saturación digital) durante el mastering.\n")
             else:
-                details += "   → Los picos están cerca del límite. Se recomienda dejar más\n"
-                details += "     margen para que el mastering tenga espacio de trabajo.\n"
+                parts.append("   → Los picos están cerca del límite. Se recomienda dejar más\n")
+                parts.append("     margen para que el mastering tenga espacio de trabajo.\n")
             
             # Add temporal info if exists
             if "temporal_analysis" in headroom_metric:
@@ -5076,18 +5420,18 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                     lang
                 )
                 if temporal:
-                    details += "  " + temporal.strip() + "\n"
+                    parts.append("  " + temporal.strip() + "\n")
             else:
-                details += "   → Headroom consistente en toda la canción.\n"
-            details += "\n"
+                parts.append("   → Headroom consistente en toda la canción.\n")
+            parts.append("\n")
         
         # TRUE PEAK
-        tp_metric = next((m for m in metrics if "True Peak" in m.get("internal_key", "")), None)
+        tp_metric = by_key.get("True Peak")
         if tp_metric:
             tp_val = tp_metric.get("value", "")
-            details += f"🔊 TRUE PEAK: {tp_val}\n"
-            details += "   → Seguro para el proceso de mastering.\n"
-            details += "     El control de picos finales y compatibilidad con codecs se gestiona en mastering.\n"
+            parts.append(f"🔊 TRUE PEAK: {tp_val}\n")
+            parts.append("   → Seguro para el proceso de mastering.\n")
+            parts.append("     El control de picos finales y compatibilidad con codecs se gestiona en mastering.\n")
             
             # Add temporal info
             if "temporal_analysis" in tp_metric:
@@ -5097,61 +5441,56 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                     lang
                 )
                 if temporal:
-                    details += "  " + temporal.strip() + "\n"
+                    parts.append("  " + temporal.strip() + "\n")
             else:
-                details += "   → Márgenes de seguridad cumplidos en toda la pista.\n"
-            details += "\n"
+                parts.append("   → Márgenes de seguridad cumplidos en toda la pista.\n")
+            parts.append("\n")
         
         # PLR (Dynamic Range)
-        plr_metric = next((m for m in metrics if "PLR" in m.get("internal_key", "")), None)
+        plr_metric = by_key.get("PLR")
         if plr_metric and plr_metric.get("value") != "N/A":
             plr_val = plr_metric.get("value", "")
-            details += f"📈 RANGO DINÁMICO (PLR): {plr_val}\n"
+            parts.append(f"📈 RANGO DINÁMICO (PLR): {plr_val}\n")
             
             # Contextual explanation based on value
             if isinstance(plr_val, str):
-                try:
-                    plr_num = float(plr_val.split()[0])
-                    if plr_num >= 12:
-                        details += "   → Buena preservación de dinámica. La mezcla respira bien.\n"
-                        details += "   → Ideal para mastering expresivo con punch natural.\n"
-                    elif plr_num >= 8:
-                        details += "   → Buen rango dinámico, apropiado para mastering.\n"
-                    else:
-                        details += "   → Algo comprimida, pero aún trabajable en mastering.\n"
-                except:
-                    details += "   → Rango dinámico medido.\n"
-            details += "\n"
+                plr_num = _display_number(plr_val)
+                if plr_num is None:
+                    parts.append("   → Rango dinámico medido.\n")
+                elif plr_num >= 12:
+                    parts.append("   → Buena preservación de dinámica. La mezcla respira bien.\n")
+                    parts.append("   → Ideal para mastering expresivo con punch natural.\n")
+                elif plr_num >= 8:
+                    parts.append("   → Buen rango dinámico, apropiado para mastering.\n")
+                else:
+                    parts.append("   → Algo comprimida, pero aún trabajable en mastering.\n")
+            parts.append("\n")
         
         # STEREO FIELD
-        stereo_metric = next((m for m in metrics if "Stereo" in m.get("internal_key", "")), None)
+        stereo_metric = by_key.get("Stereo Width")
         if stereo_metric:
             corr_val = stereo_metric.get("value", "")
             ms_ratio = stereo_metric.get("ms_ratio", 0)
             lr_balance = stereo_metric.get("lr_balance_db", 0)
             
-            details += "🎧 IMAGEN ESTÉREO:\n"
             corr_raw = stereo_metric.get("correlation", 0)
-            details += f"   • Correlación: {corr_raw:.2f}\n"
-            if ms_ratio:
-                details += f"   • Relación M/S: {ms_ratio:.2f}\n"
-            if lr_balance is not None:
-                details += f"   • Balance L/R: {_fmt_lr(lr_balance)} dB\n"
-            details += "\n"
+            mask = (bool(ms_ratio) << 1) | (lr_balance is not None)
+            lr = _fmt_lr(lr_balance) if lr_balance is not None else ""
+            parts.append(_STEREO_DETAIL_TEMPLATES["es"][mask].format(corr=corr_raw, ms_ratio=ms_ratio, lr=lr))
             
             # Check for temporal analysis (from chunked mode)
             if "temporal_analysis" in stereo_metric:
                 temporal = stereo_metric["temporal_analysis"]
                 has_flagged_timestamps = False
 
-                details += "▶ ANÁLISIS TEMPORAL:\n\n"
+                parts.append("▶ ANÁLISIS TEMPORAL:\n\n")
 
                 # v7.3.51: Feedback positivo sobre coherencia mono
                 global_corr = stereo_metric.get("correlation", 0)
                 if global_corr and global_corr >= 0.7:
-                    details += "✅ Alta coherencia mono detectada\n"
-                    details += "La mezcla mantiene buena correlación entre canales.\n"
-                    details += "Favorece el proceso de mastering y la compatibilidad en sistemas mono.\n\n"
+                    parts.append("✅ Alta coherencia mono detectada\n")
+                    parts.append("La mezcla mantiene buena correlación entre canales.\n")
+                    parts.append("Favorece el proceso de mastering y la compatibilidad en sistemas mono.\n\n")
 
                 # Correlation temporal - solo regiones que necesitan atención
                 if 'correlation' in temporal:
@@ -5162,7 +5501,7 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                     if num_regions > 0:
                         has_flagged_timestamps = True
                         region_word = "región" if num_regions == 1 else "regiones"
-                        details += f"⚠️ Correlación ({num_regions} {region_word} para prestar atención):\n"
+                        parts.append(f"⚠️ Correlación ({num_regions} {region_word} para prestar atención):\n")
 
                         # v7.3.36.4: Variaciones de mensajes de mono para evitar repetición
                         variaciones_mono_es = [
@@ -5182,57 +5521,57 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                             issue = region['issue']
                             band_corr = region.get('band_correlation')
 
-                            details += f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): "
+                            parts.append(f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): ")
 
                             # v7.3.51: Only report issues that need attention (< 0.5)
                             # Removed 'high' issue type - high correlation is not a problem
                             if issue == 'medium_low':
-                                details += f"Correlación moderada ({corr*100:.0f}%)\n"
-                                details += "      → Revisar efectos estéreo y reverbs\n"
+                                parts.append(f"Correlación moderada ({corr*100:.0f}%)\n")
+                                parts.append("      → Revisar efectos estéreo y reverbs\n")
                             elif issue == 'very_low':
-                                details += f"Correlación muy baja ({corr*100:.0f}%)\n"
+                                parts.append(f"Correlación muy baja ({corr*100:.0f}%)\n")
                                 # Rotate variation based on region index
                                 mono_msg = variaciones_mono_es[region_idx % len(variaciones_mono_es)]
-                                details += f"      → Estéreo muy amplio - {mono_msg}\n"
+                                parts.append(f"      → Estéreo muy amplio - {mono_msg}\n")
                                 # v7.3.35: Show band breakdown if available
                                 if band_corr:
                                     problem_bands = identify_problem_bands(band_corr, threshold=0.3)
                                     if problem_bands:
                                         band_names = [f"{b['name_es']} ({b['correlation']*100:.0f}%)" for b in problem_bands[:3]]
-                                        details += f"      📊 Bandas afectadas: {', '.join(band_names)}\n"
-                                        details += f"      💡 Posibles causas en {problem_bands[0]['name_es']}: {problem_bands[0]['causes_es']}\n"
+                                        parts.append(f"      📊 Bandas afectadas: {', '.join(band_names)}\n")
+                                        parts.append(f"      💡 Posibles causas en {problem_bands[0]['name_es']}: {problem_bands[0]['causes_es']}\n")
                             elif issue == 'negative':
-                                details += f"Correlación negativa ({corr*100:.0f}%)\n"
-                                details += "      → Empieza cancelación de fase - pérdida en mono\n"
+                                parts.append(f"Correlación negativa ({corr*100:.0f}%)\n")
+                                parts.append("      → Empieza cancelación de fase - pérdida en mono\n")
                                 # v7.3.35: Show band breakdown if available
                                 if band_corr:
                                     problem_bands = identify_problem_bands(band_corr, threshold=0.3)
                                     if problem_bands:
                                         band_names = [f"{b['name_es']} ({b['correlation']*100:.0f}%)" for b in problem_bands[:3]]
-                                        details += f"      📊 Bandas afectadas: {', '.join(band_names)}\n"
-                                        details += f"      💡 Posibles causas en {problem_bands[0]['name_es']}: {problem_bands[0]['causes_es']}\n"
+                                        parts.append(f"      📊 Bandas afectadas: {', '.join(band_names)}\n")
+                                        parts.append(f"      💡 Posibles causas en {problem_bands[0]['name_es']}: {problem_bands[0]['causes_es']}\n")
                             elif issue == 'negative_severe':
-                                details += f"Correlación negativa severa ({corr*100:.0f}%)\n"
-                                details += "      → Cancelación de fase severa en mono\n"
+                                parts.append(f"Correlación negativa severa ({corr*100:.0f}%)\n")
+                                parts.append("      → Cancelación de fase severa en mono\n")
                                 # v7.3.35: Show band breakdown if available
                                 if band_corr:
                                     problem_bands = identify_problem_bands(band_corr, threshold=0.3)
                                     if problem_bands:
                                         band_names = [f"{b['name_es']} ({b['correlation']*100:.0f}%)" for b in problem_bands[:3]]
-                                        details += f"      📊 Bandas afectadas: {', '.join(band_names)}\n"
-                                        details += f"      💡 Posibles causas en {problem_bands[0]['name_es']}: {problem_bands[0]['causes_es']}\n"
+                                        parts.append(f"      📊 Bandas afectadas: {', '.join(band_names)}\n")
+                                        parts.append(f"      💡 Posibles causas en {problem_bands[0]['name_es']}: {problem_bands[0]['causes_es']}\n")
                             else:  # Fallback
-                                details += f"Correlación: {corr*100:.0f}%\n"
+                                parts.append(f"Correlación: {corr*100:.0f}%\n")
                             
                             # Add spacing between regions for readability
-                            details += "\n"
+                            parts.append("\n")
                         
                         # Show remaining count if more than max_regions_to_show
                         if num_regions > max_regions_to_show:
                             remaining = num_regions - max_regions_to_show
-                            details += f"   ... y {remaining} región{'es' if remaining > 1 else ''} adicional{'es' if remaining > 1 else ''}\n"
+                            parts.append(f"   ... y {remaining} región{'es' if remaining > 1 else ''} adicional{'es' if remaining > 1 else ''}\n")
                         
-                        details += "\n"
+                        parts.append("\n")
                 
                 # M/S Ratio temporal
                 if 'ms_ratio' in temporal:
@@ -5244,7 +5583,7 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                         has_flagged_timestamps = True
                         region_word = "región" if num_regions == 1 else "regiones"
                         attention_word = "a revisar"
-                        details += f"📐 Relación M/S ({num_regions} {region_word} {attention_word}):\n"
+                        parts.append(f"📐 Relación M/S ({num_regions} {region_word} {attention_word}):\n")
 
                         # v7.3.51: Variaciones de mensajes para M/S bajo (eBook philosophy)
                         variaciones_ms_bajo_es = [
@@ -5263,24 +5602,24 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                             ms = region['avg_ms_ratio']
                             issue = region['issue']
                             
-                            details += f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): "
+                            parts.append(f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): ")
                             if issue == 'mono':
-                                details += f"Ratio bajo ({ms:.2f})\n"
+                                parts.append(f"Ratio bajo ({ms:.2f})\n")
                                 ms_msg = variaciones_ms_bajo_es[region_idx % len(variaciones_ms_bajo_es)]
-                                details += f"      → {ms_msg}\n"
+                                parts.append(f"      → {ms_msg}\n")
                             else:
-                                details += f"Ratio alto ({ms:.2f})\n"
-                                details += "      → Estéreo muy amplio - conviene verificar comportamiento en mono\n"
+                                parts.append(f"Ratio alto ({ms:.2f})\n")
+                                parts.append("      → Estéreo muy amplio - conviene verificar comportamiento en mono\n")
                             
                             # Add spacing between regions for readability
-                            details += "\n"
+                            parts.append("\n")
                         
                         # Show remaining count if more than max_regions_to_show
                         if num_regions > max_regions_to_show:
                             remaining = num_regions - max_regions_to_show
-                            details += f"   ... y {remaining} región{'es' if remaining > 1 else ''} adicional{'es' if remaining > 1 else ''}\n"
+                            parts.append(f"   ... y {remaining} región{'es' if remaining > 1 else ''} adicional{'es' if remaining > 1 else ''}\n")
                         
-                        details += "\n"
+                        parts.append("\n")
                 
                 # L/R Balance temporal
                 if 'lr_balance' in temporal:
@@ -5292,7 +5631,7 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                         has_flagged_timestamps = True
                         region_word = "región" if num_regions == 1 else "regiones"
                         attention_word = "a revisar"
-                        details += f"⚖️ Balance L/R ({num_regions} {region_word} {attention_word}):\n"
+                        parts.append(f"⚖️ Balance L/R ({num_regions} {region_word} {attention_word}):\n")
 
                         max_regions_to_show = 25
                         for region in regions[:max_regions_to_show]:
@@ -5304,32 +5643,31 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                             balance = region['avg_balance_db']
                             side = region['side']
 
-                            details += f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): "
+                            parts.append(f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): ")
                             if side == 'left':
-                                details += f"Desbalance L: +{abs(balance):.1f} dB\n"
+                                parts.append(f"Desbalance L: +{abs(balance):.1f} dB\n")
                             else:
-                                details += f"Desbalance R: {balance:.1f} dB\n"
+                                parts.append(f"Desbalance R: {balance:.1f} dB\n")
 
                             # Add spacing between regions for readability
-                            details += "\n"
+                            parts.append("\n")
 
                         # Show remaining count if more than max_regions_to_show
                         if num_regions > max_regions_to_show:
                             remaining = num_regions - max_regions_to_show
-                            details += f"   ... y {remaining} región{'es' if remaining > 1 else ''} adicional{'es' if remaining > 1 else ''}\n"
+                            parts.append(f"   ... y {remaining} región{'es' if remaining > 1 else ''} adicional{'es' if remaining > 1 else ''}\n")
 
-                        details += "\n"
+                        parts.append("\n")
 
                 if has_flagged_timestamps:
-                    details += "💡 Conviene revisar los tiempos indicados arriba en el DAW para evaluar si lo detectado en el Análisis Temporal responde a una decisión artística o si requiere un ajuste técnico antes del mastering.\n\n"
+                    parts.append("💡 Conviene revisar los tiempos indicados arriba en el DAW para evaluar si lo detectado en el Análisis Temporal responde a una decisión artística o si requiere un ajuste técnico antes del mastering.\n\n")
             
             else:
                 # No temporal analysis available
-                details += "   → Imagen estéreo con buena compatibilidad mono.\n"
-                details += "     Se traducirá bien en diferentes sistemas.\n\n"
+                parts.append(_STEREO_DETAIL_FOOTER["es"])
         
         # FREQUENCY BALANCE
-        freq_metric = next((m for m in metrics if "Frequency" in m.get("internal_key", "")), None)
+        freq_metric = by_key.get("Frequency Balance")
         if freq_metric:
             bass = freq_metric.get("low_percent", 0)  # FIXED: was "bass_pct"
             mid = freq_metric.get("mid_percent", 0)    # FIXED: was "mid_pct"
@@ -5338,14 +5676,8 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
             # Apply largest-remainder rounding so percentages sum to 100%
             bass_r, mid_r, high_r = round_band_percentages(bass, mid, high)
 
-            details += "🎼 BALANCE DE FRECUENCIAS:\n"
-            if bass:
-                details += f"   • Graves (20-250 Hz): {bass_r}%\n"
-            if mid:
-                details += f"   • Medios (250 Hz-4 kHz): {mid_r}%\n"
-            if high:
-                details += f"   • Agudos (4 kHz-20 kHz): {high_r}%\n"
-            details += "\n"
+            mask = (bool(bass) << 2) | (bool(mid) << 1) | bool(high)
+            parts.append(_FREQ_DETAIL_TEMPLATES["es"][mask].format(bass=bass_r, mid=mid_r, high=high_r))
 
             # NEW v7.3.50: Genre detection message
             detected_genre = freq_metric.get("detected_genre", "")
@@ -5360,34 +5692,32 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                 else:
                     status_word = "revisar"
                 
-                details += f"   📊 Balance de frecuencias similar a: {detected_genre} ({status_word})\n"
+                parts.append(f"   📊 Balance de frecuencias similar a: {detected_genre} ({status_word})\n")
                 
                 if tonal_issues:
-                    details += f"   ⚠️ Notas: {', '.join(tonal_issues)}\n"
+                    parts.append(f"   ⚠️ Notas: {', '.join(tonal_issues)}\n")
                 else:
-                    details += "   → Distribución tonal balanceada.\n"
+                    parts.append(_FREQ_DETAIL_FOOTER["es"])
             else:
-                details += "   → Distribución tonal balanceada.\n"
+                parts.append(_FREQ_DETAIL_FOOTER["es"])
         
-        return details
+        return "".join(parts)
     
     else:  # English
-        details = "\n\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        details += "📊 COMPLETE TECHNICAL DETAILS\n"
-        details += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+        parts = [_TECH_DETAILS_BANNER["en"]]
         
         # HEADROOM
-        headroom_metric = next((m for m in metrics if "Headroom" in m.get("internal_key", "")), None)
+        headroom_metric = by_key.get("Headroom")
         if headroom_metric:
             peak_val = headroom_metric.get("peak_db", "")
-            details += f"🎚️ HEADROOM: {peak_val}\n"
+            parts.append(f"🎚️ HEADROOM: {peak_val}\n")
             hr_status = headroom_metric.get("status", "pass")
             if hr_status in ("perfect", "pass"):
-                details += "   → Peaks leave sufficient space for processing\n"
-                details += "     without risk of clipping during mastering.\n"
+                parts.append("   → Peaks leave sufficient space for processing\n")
+                parts.append("     without risk of clipping during mastering.\n")
             else:
-                details += "   → Peaks are close to the limit. Consider leaving more\n"
-                details += "     headroom to give mastering enough processing room.\n"
+                parts.append("   → Peaks are close to the limit. Consider leaving more\n")
+                parts.append("     headroom to give mastering enough processing room.\n")
             
             if "temporal_analysis" in headroom_metric:
                 temporal = format_temporal_message(
@@ -5396,18 +5726,18 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                     lang
                 )
                 if temporal:
-                    details += "  " + temporal.strip() + "\n"
+                    parts.append("  " + temporal.strip() + "\n")
             else:
-                details += "   → Consistent headroom throughout the song.\n"
-            details += "\n"
+                parts.append("   → Consistent headroom throughout the song.\n")
+            parts.append("\n")
         
         # TRUE PEAK
-        tp_metric = next((m for m in metrics if "True Peak" in m.get("internal_key", "")), None)
+        tp_metric = by_key.get("True Peak")
         if tp_metric:
             tp_val = tp_metric.get("value", "")
-            details += f"🔊 TRUE PEAK: {tp_val}\n"
-            details += "   → Safe for the mastering process.\n"
-            details += "     Final peak control and codec compatibility are handled in mastering.\n"
+            parts.append(f"🔊 TRUE PEAK: {tp_val}\n")
+            parts.append("   → Safe for the mastering process.\n")
+            parts.append("     Final peak control and codec compatibility are handled in mastering.\n")
             
             if "temporal_analysis" in tp_metric:
                 temporal = format_temporal_message(
@@ -5416,58 +5746,53 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                     lang
                 )
                 if temporal:
-                    details += "  " + temporal.strip() + "\n"
+                    parts.append("  " + temporal.strip() + "\n")
             else:
-                details += "   → Safety margins met throughout the track.\n"
-            details += "\n"
+                parts.append("   → Safety margins met throughout the track.\n")
+            parts.append("\n")
         
         # PLR
-        plr_metric = next((m for m in metrics if "PLR" in m.get("internal_key", "")), None)
+        plr_metric = by_key.get("PLR")
         if plr_metric and plr_metric.get("value") != "N/A":
             plr_val = plr_metric.get("value", "")
-            details += f"📈 DYNAMIC RANGE (PLR): {plr_val}\n"
+            parts.append(f"📈 DYNAMIC RANGE (PLR): {plr_val}\n")
             
             if isinstance(plr_val, str):
-                try:
-                    plr_num = float(plr_val.split()[0])
-                    if plr_num >= 12:
-                        details += "   → Good dynamic preservation. Mix breathes well.\n"
-                        details += "   → Ideal for expressive mastering with natural punch.\n"
-                    elif plr_num >= 8:
-                        details += "   → Good dynamic range, appropriate for mastering.\n"
-                    else:
-                        details += "   → Somewhat compressed, but still workable in mastering.\n"
-                except:
-                    details += "   → Dynamic range measured.\n"
-            details += "\n"
+                plr_num = _display_number(plr_val)
+                if plr_num is None:
+                    parts.append("   → Dynamic range measured.\n")
+                elif plr_num >= 12:
+                    parts.append("   → Good dynamic preservation. Mix breathes well.\n")
+                    parts.append("   → Ideal for expressive mastering with natural punch.\n")
+                elif plr_num >= 8:
+                    parts.append("   → Good dynamic range, appropriate for mastering.\n")
+                else:
+                    parts.append("   → Somewhat compressed, but still workable in mastering.\n")
+            parts.append("\n")
         
         # STEREO FIELD
-        stereo_metric = next((m for m in metrics if "Stereo" in m.get("internal_key", "")), None)
+        stereo_metric = by_key.get("Stereo Width")
         if stereo_metric:
             corr_val = stereo_metric.get("value", "")
             ms_ratio = stereo_metric.get("ms_ratio", 0)
             lr_balance = stereo_metric.get("lr_balance_db", 0)
             
-            details += "🎧 STEREO FIELD:\n"
-            details += f"   • Correlation: {corr_val}\n"
-            if ms_ratio:
-                details += f"   • M/S Ratio: {ms_ratio:.2f}\n"
-            if lr_balance is not None:
-                details += f"   • L/R Balance: {_fmt_lr(lr_balance)} dB\n"
-            details += "\n"
+            mask = (bool(ms_ratio) << 1) | (lr_balance is not None)
+            lr = _fmt_lr(lr_balance) if lr_balance is not None else ""
+            parts.append(_STEREO_DETAIL_TEMPLATES["en"][mask].format(corr=corr_val, ms_ratio=ms_ratio, lr=lr))
             
             # Check for temporal analysis (from chunked mode)
             if "temporal_analysis" in stereo_metric:
                 temporal = stereo_metric["temporal_analysis"]
                 
-                details += "▶ TEMPORAL ANALYSIS:\n\n"
+                parts.append("▶ TEMPORAL ANALYSIS:\n\n")
                 
                 # v7.3.51: Positive feedback about mono coherence
                 global_corr = stereo_metric.get("correlation", 0)
                 if global_corr and global_corr >= 0.7:
-                    details += "✅ High mono coherence detected\n"
-                    details += "The mix maintains good correlation between channels.\n"
-                    details += "Favors the mastering process and mono system compatibility.\n\n"
+                    parts.append("✅ High mono coherence detected\n")
+                    parts.append("The mix maintains good correlation between channels.\n")
+                    parts.append("Favors the mastering process and mono system compatibility.\n\n")
                 
                 # Correlation temporal - only regions that need attention
                 if 'correlation' in temporal:
@@ -5476,7 +5801,7 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                     regions = corr_data.get('regions', [])
                     
                     if num_regions > 0:
-                        details += f"⚠️ Correlation ({num_regions} region{'s' if num_regions > 1 else ''} to pay attention to):\n"
+                        parts.append(f"⚠️ Correlation ({num_regions} region{'s' if num_regions > 1 else ''} to pay attention to):\n")
                         
                         # v7.3.36.4: Variations to avoid mechanical repetition
                         variaciones_mono_en = [
@@ -5496,57 +5821,57 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                             issue = region['issue']
                             band_corr = region.get('band_correlation')
                             
-                            details += f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): "
+                            parts.append(f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): ")
                             
                             # v7.3.51: Only report issues that need attention (< 0.5)
                             # Removed 'high' issue type - high correlation is not a problem
                             if issue == 'medium_low':
-                                details += f"Moderate correlation ({corr*100:.0f}%)\n"
-                                details += "      → Check stereo effects and reverbs\n"
+                                parts.append(f"Moderate correlation ({corr*100:.0f}%)\n")
+                                parts.append("      → Check stereo effects and reverbs\n")
                             elif issue == 'very_low':
-                                details += f"Very low correlation ({corr*100:.0f}%)\n"
+                                parts.append(f"Very low correlation ({corr*100:.0f}%)\n")
                                 # Rotate variation based on region index
                                 mono_msg = variaciones_mono_en[region_idx % len(variaciones_mono_en)]
-                                details += f"      → Very wide stereo - {mono_msg}\n"
+                                parts.append(f"      → Very wide stereo - {mono_msg}\n")
                                 # v7.3.35: Show band breakdown if available
                                 if band_corr:
                                     problem_bands = identify_problem_bands(band_corr, threshold=0.3)
                                     if problem_bands:
                                         band_names = [f"{b['name_en']} ({b['correlation']*100:.0f}%)" for b in problem_bands[:3]]
-                                        details += f"      📊 Affected bands: {', '.join(band_names)}\n"
-                                        details += f"      💡 Possible causes in {problem_bands[0]['name_en']}: {problem_bands[0]['causes_en']}\n"
+                                        parts.append(f"      📊 Affected bands: {', '.join(band_names)}\n")
+                                        parts.append(f"      💡 Possible causes in {problem_bands[0]['name_en']}: {problem_bands[0]['causes_en']}\n")
                             elif issue == 'negative':
-                                details += f"Negative correlation ({corr*100:.0f}%)\n"
-                                details += "      → Phase cancellation begins - mono loss\n"
+                                parts.append(f"Negative correlation ({corr*100:.0f}%)\n")
+                                parts.append("      → Phase cancellation begins - mono loss\n")
                                 # v7.3.35: Show band breakdown if available
                                 if band_corr:
                                     problem_bands = identify_problem_bands(band_corr, threshold=0.3)
                                     if problem_bands:
                                         band_names = [f"{b['name_en']} ({b['correlation']*100:.0f}%)" for b in problem_bands[:3]]
-                                        details += f"      📊 Affected bands: {', '.join(band_names)}\n"
-                                        details += f"      💡 Possible causes in {problem_bands[0]['name_en']}: {problem_bands[0]['causes_en']}\n"
+                                        parts.append(f"      📊 Affected bands: {', '.join(band_names)}\n")
+                                        parts.append(f"      💡 Possible causes in {problem_bands[0]['name_en']}: {problem_bands[0]['causes_en']}\n")
                             elif issue == 'negative_severe':
-                                details += f"Severe negative correlation ({corr*100:.0f}%)\n"
-                                details += "      → Severe phase cancellation in mono\n"
+                                parts.append(f"Severe negative correlation ({corr*100:.0f}%)\n")
+                                parts.append("      → Severe phase cancellation in mono\n")
                                 # v7.3.35: Show band breakdown if available
                                 if band_corr:
                                     problem_bands = identify_problem_bands(band_corr, threshold=0.3)
                                     if problem_bands:
                                         band_names = [f"{b['name_en']} ({b['correlation']*100:.0f}%)" for b in problem_bands[:3]]
-                                        details += f"      📊 Affected bands: {', '.join(band_names)}\n"
-                                        details += f"      💡 Possible causes in {problem_bands[0]['name_en']}: {problem_bands[0]['causes_en']}\n"
+                                        parts.append(f"      📊 Affected bands: {', '.join(band_names)}\n")
+                                        parts.append(f"      💡 Possible causes in {problem_bands[0]['name_en']}: {problem_bands[0]['causes_en']}\n")
                             else:  # Fallback
-                                details += f"Correlation: {corr*100:.0f}%\n"
+                                parts.append(f"Correlation: {corr*100:.0f}%\n")
                             
                             # Add spacing between regions for readability
-                            details += "\n"
+                            parts.append("\n")
                         
                         # Show remaining count if more than max_regions_to_show
                         if num_regions > max_regions_to_show:
                             remaining = num_regions - max_regions_to_show
-                            details += f"   ... and {remaining} additional region{'s' if remaining > 1 else ''}\n"
+                            parts.append(f"   ... and {remaining} additional region{'s' if remaining > 1 else ''}\n")
                         
-                        details += "\n"
+                        parts.append("\n")
                 
                 # M/S Ratio temporal
                 if 'ms_ratio' in temporal:
@@ -5555,7 +5880,7 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                     regions = ms_data.get('regions', [])
                     
                     if num_regions > 0:
-                        details += f"📐 M/S Ratio ({num_regions} region{'s' if num_regions > 1 else ''} to review):\n"
+                        parts.append(f"📐 M/S Ratio ({num_regions} region{'s' if num_regions > 1 else ''} to review):\n")
                         
                         # v7.3.51: Message variations for low M/S (eBook philosophy)
                         variaciones_ms_bajo_en = [
@@ -5574,24 +5899,24 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                             ms = region['avg_ms_ratio']
                             issue = region['issue']
                             
-                            details += f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): "
+                            parts.append(f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): ")
                             if issue == 'mono':
-                                details += f"Low ratio ({ms:.2f})\n"
+                                parts.append(f"Low ratio ({ms:.2f})\n")
                                 ms_msg = variaciones_ms_bajo_en[region_idx % len(variaciones_ms_bajo_en)]
-                                details += f"      → {ms_msg}\n"
+                                parts.append(f"      → {ms_msg}\n")
                             else:
-                                details += f"High ratio ({ms:.2f})\n"
-                                details += "      → Very wide stereo - verify mono behavior\n"
+                                parts.append(f"High ratio ({ms:.2f})\n")
+                                parts.append("      → Very wide stereo - verify mono behavior\n")
                             
                             # Add spacing between regions for readability
-                            details += "\n"
+                            parts.append("\n")
                         
                         # Show remaining count if more than max_regions_to_show
                         if num_regions > max_regions_to_show:
                             remaining = num_regions - max_regions_to_show
-                            details += f"   ... and {remaining} additional region{'s' if remaining > 1 else ''}\n"
+                            parts.append(f"   ... and {remaining} additional region{'s' if remaining > 1 else ''}\n")
                         
-                        details += "\n"
+                        parts.append("\n")
                 
                 # L/R Balance temporal
                 if 'lr_balance' in temporal:
@@ -5600,7 +5925,7 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                     regions = lr_data.get('regions', [])
                     
                     if num_regions > 0:
-                        details += f"⚖️ L/R Balance ({num_regions} region{'s' if num_regions > 1 else ''} to review):\n"
+                        parts.append(f"⚖️ L/R Balance ({num_regions} region{'s' if num_regions > 1 else ''} to review):\n")
                         
                         max_regions_to_show = 25
                         for region in regions[:max_regions_to_show]:
@@ -5612,31 +5937,30 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                             balance = region['avg_balance_db']
                             side = region['side']
                             
-                            details += f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): "
+                            parts.append(f"   • {start_min}:{start_sec:02d} → {end_min}:{end_sec:02d} ({dur}s): ")
                             if side == 'left':
-                                details += f"L imbalance: +{abs(balance):.1f} dB\n"
+                                parts.append(f"L imbalance: +{abs(balance):.1f} dB\n")
                             else:
-                                details += f"R imbalance: {balance:.1f} dB\n"
+                                parts.append(f"R imbalance: {balance:.1f} dB\n")
                             
                             # Add spacing between regions for readability
-                            details += "\n"
+                            parts.append("\n")
                         
                         # Show remaining count if more than max_regions_to_show
                         if num_regions > max_regions_to_show:
                             remaining = num_regions - max_regions_to_show
-                            details += f"   ... and {remaining} additional region{'s' if remaining > 1 else ''}\n"
+                            parts.append(f"   ... and {remaining} additional region{'s' if remaining > 1 else ''}\n")
                         
-                        details += "\n"
+                        parts.append("\n")
                 
-                details += "💡 Review the timestamps above in your DAW to evaluate if what's detected in the Temporal Analysis is an artistic decision or if it requires a technical adjustment before mastering.\n\n"
+                parts.append("💡 Review the timestamps above in your DAW to evaluate if what's detected in the Temporal Analysis is an artistic decision or if it requires a technical adjustment before mastering.\n\n")
             
             else:
                 # No temporal analysis available
-                details += "   → Stereo image with good mono compatibility.\n"
-                details += "     Will translate well across systems.\n\n"
+                parts.append(_STEREO_DETAIL_FOOTER["en"])
         
         # FREQUENCY BALANCE
-        freq_metric = next((m for m in metrics if "Frequency" in m.get("internal_key", "")), None)
+        freq_metric = by_key.get("Frequency Balance")
         if freq_metric:
             bass = freq_metric.get("low_percent", 0)  # FIXED: was "bass_pct"
             mid = freq_metric.get("mid_percent", 0)    # FIXED: was "mid_pct"
@@ -5645,14 +5969,8 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
             # Apply largest-remainder rounding so percentages sum to 100%
             bass_r, mid_r, high_r = round_band_percentages(bass, mid, high)
 
-            details += "🎼 FREQUENCY BALANCE:\n"
-            if bass:
-                details += f"   • Lows (20-250 Hz): {bass_r}%\n"
-            if mid:
-                details += f"   • Mids (250 Hz-4 kHz): {mid_r}%\n"
-            if high:
-                details += f"   • Highs (4 kHz-20 kHz): {high_r}%\n"
-            details += "\n"
+            mask = (bool(bass) << 2) | (bool(mid) << 1) | bool(high)
+            parts.append(_FREQ_DETAIL_TEMPLATES["en"][mask].format(bass=bass_r, mid=mid_r, high=high_r))
 
             # NEW v7.3.50: Genre detection message
             detected_genre = freq_metric.get("detected_genre", "")
@@ -5667,16 +5985,16 @@ def build_technical_details(metrics: List[Dict], lang: str = 'es') -> str:
                 else:
                     status_word = "review"
                 
-                details += f"   📊 Frequency balance similar to: {detected_genre} ({status_word})\n"
+                parts.append(f"   📊 Frequency balance similar to: {detected_genre} ({status_word})\n")
                 
                 if tonal_issues:
-                    details += f"   ⚠️ Notes: {', '.join(tonal_issues)}\n"
+                    parts.append(f"   ⚠️ Notes: {', '.join(tonal_issues)}\n")
                 else:
-                    details += "   → Balanced tonal distribution.\n"
+                    parts.append(_FREQ_DETAIL_FOOTER["en"])
             else:
-                details += "   → Balanced tonal distribution.\n"
+                parts.append(_FREQ_DETAIL_FOOTER["en"])
         
-        return details
+        return "".join(parts)
 
 
 def analyze_file_chunked(
@@ -5821,6 +6139,7 @@ def analyze_file_chunked(
     }
     
     # 3. Process each chunk
+    tp_scratch = None  # True peak envelope buffer, reused across chunks
     for i in range(num_chunks):
         start_time = i * chunk_duration
         if i == num_chunks - 1:
@@ -5855,8 +6174,11 @@ def analyze_file_chunked(
 
         # Calculate metrics for this chunk
         try:
+            # One pass of sums feeds peak, RMS, correlation, L/R and M/S below
+            chunk_moments = signal_moments(y)
+            
             # Peak
-            chunk_peak = np.max(np.abs(y))
+            chunk_peak = float(chunk_moments["peak"].max())
             if chunk_peak <= 0:
                 chunk_peak_db = -120.0
             else:
@@ -5865,12 +6187,16 @@ def analyze_file_chunked(
                 except (ValueError, ZeroDivisionError):
                     chunk_peak_db = -120.0
             
-            # True Peak (oversampled)
-            chunk_tp_db = oversampled_true_peak_db(y, oversample)
+            # True Peak (oversampled). The envelope is reused by the 5 s windows below
+            # Same-length chunks share one envelope buffer (no 4 bytes/sample alloc per chunk)
+            if tp_scratch is None or tp_scratch.size < y.shape[1]:
+                tp_scratch = np.empty(y.shape[1], dtype=np.float32)
+            chunk_tp_envelope = _oversampled_abs_envelope(y, max(1, oversample), out=tp_scratch[:y.shape[1]])
+            chunk_tp_db = oversampled_true_peak_db(y, oversample, envelope=chunk_tp_envelope)
             
             # LUFS (integrated)
             if HAS_PYLOUDNORM:
-                meter = pyln.Meter(sr)
+                meter = _loudness_meter(sr)
                 chunk_lufs_raw = meter.integrated_loudness(y.T)
                 # Handle -inf from pyloudnorm for very quiet signals or silence
                 if np.isfinite(chunk_lufs_raw):
@@ -5882,11 +6208,9 @@ def analyze_file_chunked(
                 chunk_lufs = -23.0  # Safe default
             
             # Spatial metrics
-            chunk_corr = stereo_correlation(y)
-            chunk_lr = calculate_lr_balance(y)
-            
-            debug_ms = (i == 0)  # Only first chunk to avoid spam
-            chunk_ms, _, _ = calculate_ms_ratio(y, debug=debug_ms)
+            chunk_corr = stereo_correlation(y, chunk_moments)
+            chunk_lr = calculate_lr_balance(y, chunk_moments)
+            chunk_ms, _, _ = calculate_ms_ratio(y, moments=chunk_moments)
             
             # Frequency balance (NEW - calculate per chunk)
             chunk_fb = band_balance_db(y, sr)
@@ -5898,12 +6222,12 @@ def analyze_file_chunked(
             # Calculate RMS for this chunk (for proper Crest Factor)
             if y.shape[0] > 1:
                 # Stereo: combined RMS
-                rms_l = float(np.sqrt(np.mean(y[0].astype(np.float64) ** 2)))
-                rms_r = float(np.sqrt(np.mean(y[1].astype(np.float64) ** 2)))
+                rms_l = _channel_rms(chunk_moments, 0)
+                rms_r = _channel_rms(chunk_moments, 1)
                 chunk_rms = float(np.sqrt((rms_l**2 + rms_r**2) / 2))
             else:
                 # Mono
-                chunk_rms = float(np.sqrt(np.mean(y[0].astype(np.float64) ** 2)))
+                chunk_rms = _channel_rms(chunk_moments, 0)
             
             chunk_rms_db = 20 * math.log10(chunk_rms) if chunk_rms > 0 else -120.0
             results['rms_values'].append(chunk_rms_db)
@@ -5931,17 +6255,10 @@ def analyze_file_chunked(
 
             # v1.5: Store raw RMS per 500ms window for energy curve aggregation
             _e_audio = y.mean(axis=0) if y.ndim > 1 and y.shape[0] > 1 else (y[0] if y.ndim > 1 else y)
-            _e_audio = _e_audio.astype(np.float64)
             _e_win = int(sr * 500 / 1000)
             if _e_win < 1:
                 _e_win = 1
-            _e_n = max(1, len(_e_audio) // _e_win)
-            _e_rms_list = []
-            for _e_i in range(_e_n):
-                _e_s = _e_i * _e_win
-                _e_e = min(_e_s + _e_win, len(_e_audio))
-                _e_rms_list.append(float(np.sqrt(np.mean(_e_audio[_e_s:_e_e] ** 2))))
-            results['energy_rms_per_chunk'].append(_e_rms_list)
+            results['energy_rms_per_chunk'].append(_windowed_rms(_e_audio, _e_win).tolist())
 
             # ═══════════════════════════════════════════════════════════
             # SUB-CHUNK TEMPORAL ANALYSIS (5-second windows with 50% overlap)
@@ -5957,6 +6274,24 @@ def analyze_file_chunked(
             # Calculate number of windows with overlap
             num_samples = y.shape[1]
             num_windows = int(np.ceil((num_samples - window_samples) / hop_samples)) + 1
+            # Window true peaks are read from chunk_tp_envelope (oversampled once above)
+            
+            # Peak, correlation, M/S ratio and L/R balance of every window from one
+            # compiled pass (same arithmetic as peak_dbfs, stereo_correlation,
+            # calculate_ms_ratio and calculate_lr_balance on each window)
+            win_offsets = np.arange(max(num_windows, 0)) * hop_samples
+            win_ends = np.minimum(win_offsets + window_samples, num_samples)
+            win_moments = window_moments(y, win_offsets, win_ends)
+            win_peaks = win_moments["peak"].max(axis=1)
+            win_corrs = _window_correlations(win_moments)
+            win_n = np.maximum(win_moments["n"], 1)
+            win_mid_rms = np.sqrt(win_moments["mid_energy"] / (4 * win_n))
+            win_side_rms = np.sqrt(win_moments["side_energy"] / (4 * win_n))
+            win_ms_ratios = np.where(win_mid_rms > 1e-9, win_side_rms / (win_mid_rms + 1e-12), 0.0)
+            win_rms = np.sqrt(win_moments["sum_sq"] / win_n[:, None])
+            win_silent = (win_rms[:, 0] < 1e-9) | (win_rms[:, 1] < 1e-9)
+            win_lr_balances = np.zeros(win_offsets.size)
+            win_lr_balances[~win_silent] = 20 * np.log10(win_rms[~win_silent, 0] / win_rms[~win_silent, 1])
             
             for w in range(num_windows):
                 window_offset = w * hop_samples
@@ -5972,7 +6307,7 @@ def analyze_file_chunked(
                 
                 # 1. True Peak temporal (per window)
                 # Terminal uses threshold of 0.0 dBTP (not -1.0)
-                window_tp = oversampled_true_peak_db(window, oversample)
+                window_tp = _amplitude_to_db(float(chunk_tp_envelope[window_offset:window_end].max()))
                 if window_tp > 0.0:  # Changed from -1.0 to 0.0 (terminal threshold)
                     results['tp_problem_chunks'].append({
                         'chunk': i + 1,
@@ -5983,7 +6318,7 @@ def analyze_file_chunked(
                     })
                 
                 # 2. Sample clipping temporal (per window)
-                window_peak = np.max(np.abs(window))
+                window_peak = float(win_peaks[w])
                 if window_peak >= 0.999999:
                     results['clipping_chunks'].append({
                         'chunk': i + 1,
@@ -5999,7 +6334,7 @@ def analyze_file_chunked(
                 # - very_low (<0.3): Severe phase issues
                 # - negative (<0.0): Phase inversion
                 # NOTE: 0.3-0.7 (30-70%) is HEALTHY stereo, NOT a problem!
-                window_corr = stereo_correlation(window)
+                window_corr = float(win_corrs[w])
                 
                 # v7.3.35: Calculate band correlation only when there's a problem
                 # (to avoid overhead on healthy windows)
@@ -6063,7 +6398,7 @@ def analyze_file_chunked(
                     })
                 
                 # 4. M/S Ratio temporal (per window)
-                window_ms, _, _ = calculate_ms_ratio(window)
+                window_ms = float(win_ms_ratios[w])
                 if window_ms < 0.1:
                     results['ms_ratio_problem_chunks'].append({
                         'chunk': i + 1,
@@ -6086,7 +6421,7 @@ def analyze_file_chunked(
                     })
                 
                 # 5. L/R Balance temporal (per window)
-                window_lr = calculate_lr_balance(window)
+                window_lr = float(win_lr_balances[w])
                 if abs(window_lr) > 2.0:
                     results['lr_balance_problem_chunks'].append({
                         'chunk': i + 1,
@@ -6097,6 +6432,7 @@ def analyze_file_chunked(
                         'side': 'left' if window_lr > 0 else 'right',
                         'severity': 'critical' if abs(window_lr) > 3.0 else 'warning'
                     })
+            del chunk_tp_envelope
             
             print(f"   ✅ Peak: {chunk_peak_db:.1f} dBFS, TP: {chunk_tp_db:.1f} dBTP, LUFS: {chunk_lufs:.2f}")
             
@@ -6124,6 +6460,8 @@ def analyze_file_chunked(
             if (i + 1) % 3 == 0 or i == num_chunks - 1:
                 gc.collect()
 
+    del tp_scratch
+    
     print("Aggregating results...")
     
     # 4. Aggregate results using weighted average
@@ -8285,6 +8623,84 @@ def iter_audio_files(p: Path) -> List[Path]:
     return files
 
 
+# Caché en disco de análisis completos (solo CLI, opt-in con --cache).
+# El servidor nunca la usa: sus archivos son temporales por request.
+ANALYSIS_CACHE_DIR = Path.home() / ".cache" / "masteringready" / "analyzer_v1"
+# Subir a mano cuando cambie la forma del reporte guardado
+ANALYZER_CACHE_VERSION = 2
+# Dependencias cuyo cambio de versión invalida la caché
+_ANALYSIS_CACHE_DEPENDENCIES = ("numpy", "scipy", "librosa", "soundfile", "numba", "pyloudnorm")
+
+
+@lru_cache(maxsize=1)
+def _dependency_versions() -> Tuple[Optional[str], ...]:
+    """Versión instalada de cada paquete de _ANALYSIS_CACHE_DEPENDENCIES (None si falta)."""
+    versions = []
+    for name in _ANALYSIS_CACHE_DEPENDENCIES:
+        try:
+            versions.append(metadata.version(name))
+        except metadata.PackageNotFoundError:
+            versions.append(None)
+    return tuple(versions)
+
+
+def _analysis_cache_key(path: Path, oversample: int, genre: Optional[str], strict: bool, lang: str) -> str:
+    """
+    Clave por ruta + tamaño + mtime del archivo (sin leer el audio) y por los
+    parámetros del análisis. Incluye ANALYZER_CACHE_VERSION, el mtime de
+    analyzer.py y de interpretative_texts.py (las interpretaciones van dentro
+    del reporte), HAS_PYLOUDNORM y las versiones de las dependencias de
+    análisis, así que editar el código o los textos, o actualizar alguna de
+    esas dependencias, invalida lo guardado.
+    """
+    st = path.stat()
+    code_mtime = Path(__file__).stat().st_mtime_ns
+    texts_mtime = None
+    if HAS_INTERPRETATIVE_TEXTS:
+        texts_mtime = Path(sys.modules["interpretative_texts"].__file__).stat().st_mtime_ns
+    raw = repr((
+        ANALYZER_CACHE_VERSION, str(path.resolve()), st.st_size, st.st_mtime_ns,
+        oversample, genre, strict, lang, code_mtime, texts_mtime, HAS_PYLOUDNORM,
+        _dependency_versions(),
+    ))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def analyze_file_cached(path: Path, oversample: int = 4, genre: Optional[str] = None, strict: bool = False, lang: str = "en") -> Dict[str, Any]:
+    """
+    analyze_file con caché en disco bajo ANALYSIS_CACHE_DIR. Re-analizar el
+    mismo archivo con los mismos parámetros devuelve el resultado guardado sin
+    cargar el audio. El reporte solo tiene tipos básicos y se guarda como JSON.
+    Una entrada ilegible se borra y se analiza de nuevo; un directorio no
+    escribible solo hace que no se guarde.
+    """
+    key = _analysis_cache_key(path, oversample, genre, strict, lang)
+    entry = ANALYSIS_CACHE_DIR / f"{key}.json"
+    try:
+        with open(entry, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError):
+        # Entrada corrupta o truncada: se descarta para no fallar en cada corrida
+        try:
+            entry.unlink()
+        except OSError:
+            pass
+
+    result = analyze_file(path, oversample=oversample, genre=genre, strict=strict, lang=lang)
+
+    try:
+        ANALYSIS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(result, fh, ensure_ascii=False)
+        tmp.replace(entry)
+    except OSError as e:
+        print(f"⚠️  No se pudo guardar en caché: {e}", file=sys.stderr)
+    return result
+
+
 def generate_short_mode_report(report: Dict[str, Any], strict: bool = False, lang: str = 'en', filename: str = "") -> str:
     """
     Generate short mode report with bullets showing positive aspects and areas to improve.
@@ -9502,6 +9918,17 @@ def main() -> None:
         action="store_true",
         help="Narrative written feedback (engineer-style paragraph, perfect for emails/reports)."
     )
+    ap.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse stored results for unchanged files (cache in ~/.cache/masteringready)."
+    )
+    ap.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Archivos analizados en paralelo, uno por proceso (default: 1)."
+    )
     args = ap.parse_args()
 
     lang = _pick_lang(args.lang)
@@ -9530,15 +9957,37 @@ def main() -> None:
         print("❌ No audio files found / No se encontraron archivos de audio en la ruta indicada.", file=sys.stderr)
         sys.exit(1)
 
+    if args.jobs < 1:
+        print("❌ Error: --jobs debe ser 1 o más", file=sys.stderr)
+        sys.exit(1)
+
+    analyze = analyze_file_cached if args.cache else analyze_file
+    analyze_kwargs = dict(oversample=oversample, genre=args.genre, strict=args.strict, lang=lang)
+
     reports = []
-    for f in files:
-        try:
-            print(f"\n{UI_TEXT[lang]['analyzing']}: {f.name}...")
-            report = analyze_file(f, oversample=oversample, genre=args.genre, strict=args.strict, lang=lang)
-            reports.append(report)
-        except Exception as e:
-            print(f"❌ Error analyzing {f.name} / Error analizando {f.name}: {e}", file=sys.stderr)
-            continue
+    if args.jobs > 1 and len(files) > 1:
+        # Un archivo por proceso; los resultados se recogen en el orden de
+        # entrada, así que la salida es la misma que en serie. Cada worker usa
+        # un solo hilo de numba para no sobresuscribir los cores.
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(files)), initializer=set_num_threads, initargs=(1,)) as pool:
+            futures = []
+            for f in files:
+                print(f"\n{UI_TEXT[lang]['analyzing']}: {f.name}...")
+                futures.append(pool.submit(analyze, f, **analyze_kwargs))
+            for f, future in zip(files, futures):
+                try:
+                    reports.append(future.result())
+                except Exception as e:
+                    print(f"❌ Error analyzing {f.name} / Error analizando {f.name}: {e}", file=sys.stderr)
+                    continue
+    else:
+        for f in files:
+            try:
+                print(f"\n{UI_TEXT[lang]['analyzing']}: {f.name}...")
+                reports.append(analyze(f, **analyze_kwargs))
+            except Exception as e:
+                print(f"❌ Error analyzing {f.name} / Error analizando {f.name}: {e}", file=sys.stderr)
+                continue
 
     if not reports:
         print("❌ No se pudo analizar ningún archivo", file=sys.stderr)
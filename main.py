@@ -180,7 +180,7 @@ def sanitize_filename_for_http(filename: str) -> str:
 
 # Import analyzer module
 try:
-    from analyzer import analyze_file, write_report, generate_cta, generate_short_mode_report, generate_visual_report, generate_complete_pdf
+    from analyzer import analyze_file, write_report, generate_cta, generate_short_mode_report, generate_visual_report, generate_complete_pdf, warm_up_kernels
     logger.info("✅ Analyzer module imported successfully")
 except ImportError as e:
     logger.error(f"❌ Failed to import analyzer: {e}")
@@ -257,6 +257,18 @@ async def startup_validation():
     except Exception as e:
         logger.warning(f"⚠️ ffmpeg not available — AAC/M4A conversion will fail: {e}")
 
+    # Compile the analyzer's numba kernels off the event loop, so the first
+    # upload after a deploy or restart does not pay the JIT cost
+    def _warm_up():
+        try:
+            t0 = time.time()
+            warm_up_kernels()
+            logger.info(f"✅ Analyzer kernels ready ({time.time() - t0:.1f}s)")
+        except Exception as e:
+            logger.warning(f"⚠️ Analyzer kernel warm-up failed: {e}")
+
+    asyncio.get_running_loop().run_in_executor(None, _warm_up)
+
     # Check optional modules
     logger.info(f"📦 IP rate limiting: {'enabled' if IP_LIMITER_AVAILABLE else 'disabled'}")
     logger.info(f"📦 Telegram alerts: {'enabled' if TELEGRAM_ENABLED else 'disabled'}")